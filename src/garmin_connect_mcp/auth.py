@@ -54,3 +54,14 @@ def get_token_base64_path() -> str:
     """Get the base64 token file path."""
     config = load_config()
     return config.garmintokens_base64
+
+
+def get_capabilities_path() -> Path:
+    """
+    Get the file recording endpoints unsupported by each user's account.
+
+    It sits beside the token directory rather than inside it, as any file in the
+    token directory is taken to mean saved tokens exist.
+    """
+    token_dir = Path(load_config().garmintokens).expanduser()
+    return token_dir.with_name(f"{token_dir.name}_capabilities.json")
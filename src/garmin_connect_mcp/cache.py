@@ -1,14 +1,27 @@
 """Caching utilities for Garmin Connect MCP tools."""
 
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import Future
+from contextvars import ContextVar
 from functools import wraps
 from typing import Any
 
 from .config import get_tool_config
 
-# Global cache storage
-_cache: dict[str, tuple[Any, float]] = {}
+# Global cache storage, least recently used first
+_cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+_cache_lock = threading.Lock()
+_evictions = 0
+
+# Loads in progress per cache key, resolving to (value, stale age or None)
+_inflight: dict[str, Future[tuple[Any, float | None]]] = {}
+_inflight_lock = threading.Lock()
+
+# Ages in seconds of expired entries served as fallbacks in the current context
+_stale_ages: ContextVar[list[float] | None] = ContextVar("stale_ages", default=None)
 
 
 def cached_call(cache_key_prefix: str, ttl_seconds: int | None = None) -> Callable:
@@ -36,15 +49,16 @@ def cached_call(cache_key_prefix: str, ttl_seconds: int | None = None) -> Callab
             cache_key = f"{cache_key_prefix}:{func.__name__}:{args}:{kwargs}"
 
             # Check cache
-            if cache_key in _cache:
-                cached_value, cached_time = _cache[cache_key]
+            entry = _lookup(cache_key)
+            if entry is not None:
+                cached_value, cached_time = entry
                 ttl = ttl_seconds if ttl_seconds is not None else config.cache_ttl_seconds
                 if time.time() - cached_time < ttl:
                     return cached_value
 
             # Call function and cache result
             result = await func(*args, **kwargs)
-            _cache[cache_key] = (result, time.time())
+            _store(cache_key, result)
             return result
 
         return wrapper
@@ -52,6 +66,120 @@ def cached_call(cache_key_prefix: str, ttl_seconds: int | None = None) -> Callab
     return decorator
 
 
+def get_or_call(
+    cache_key: str,
+    ttl_seconds: float,
+    func: Callable[[], Any],
+    stale_seconds: float = 0,
+    use_stale: Callable[[Exception], bool] | None = None,
+) -> Any:
+    """
+    Return a cached value, calling func to populate the cache on a miss.
+
+    Concurrent misses for the same key share a single call to func. Exceptions raised
+    by func propagate and nothing is cached. If use_stale accepts the exception and an
+    expired entry younger than stale_seconds exists, that entry is returned instead and
+    recorded as a stale hit (see track_stale_hits).
+
+    Args:
+        cache_key: Key to store the result under
+        ttl_seconds: Time to live in seconds
+        func: Zero-argument callable producing the value
+        stale_seconds: Maximum age of an expired entry usable as a fallback
+        use_stale: Predicate deciding which exceptions fall back to an expired entry
+
+    Returns:
+        Cached or freshly computed value
+    """
+    entry = _lookup(cache_key)
+    if entry is not None:
+        cached_value, cached_time = entry
+        if time.time() - cached_time < ttl_seconds:
+            return cached_value
+
+    with _inflight_lock:
+        pending = _inflight.get(cache_key)
+        leader = pending is None
+        if pending is None:
+            pending = _inflight[cache_key] = Future()
+
+    if leader:
+        try:
+            pending.set_result(_load(cache_key, func, stale_seconds, use_stale))
+        except Exception as e:
+            pending.set_exception(e)
+        finally:
+            with _inflight_lock:
+                del _inflight[cache_key]
+
+    value, stale_age = pending.result()
+    if stale_age is not None:
+        ages = _stale_ages.get()
+        if ages is not None:
+            ages.append(stale_age)
+    return value
+
+
+def _load(
+    cache_key: str,
+    func: Callable[[], Any],
+    stale_seconds: float,
+    use_stale: Callable[[Exception], bool] | None,
+) -> tuple[Any, float | None]:
+    """Call func and cache its result, falling back to an expired entry if allowed."""
+    try:
+        result = func()
+    except Exception as e:
+        entry = _cache.get(cache_key)
+        if entry is None or use_stale is None or not use_stale(e):
+            raise
+        age = time.time() - entry[1]
+        if age >= stale_seconds:
+            raise
+        return entry[0], age
+
+    _store(cache_key, result)
+    return result, None
+
+
+def _lookup(cache_key: str) -> tuple[Any, float] | None:
+    """Get a cache entry, marking it as recently used."""
+    with _cache_lock:
+        entry = _cache.get(cache_key)
+        if entry is not None:
+            _cache.move_to_end(cache_key)
+        return entry
+
+
+def _store(cache_key: str, value: Any) -> None:
+    """Cache a value, evicting the least recently used entries beyond cache_max_entries."""
+    global _evictions
+
+    max_entries = get_tool_config().cache_max_entries
+    with _cache_lock:
+        _cache[cache_key] = (value, time.time())
+        _cache.move_to_end(cache_key)
+        while len(_cache) > max_entries:
+            _cache.popitem(last=False)
+            _evictions += 1
+
+
+def track_stale_hits() -> None:
+    """Start recording stale fallbacks served in the current context (one tool call)."""
+    _stale_ages.set([])
+
+
+def get_stale_age() -> float | None:
+    """
+    Get the age of the oldest stale fallback served in the current context.
+
+    Returns:
+        Age in seconds, or None if every cached value served was fresh
+    """
+    ages = _stale_ages.get()
+    return max(ages) if ages else None
+
+
 def clear_cache(prefix: str | None = None) -> None:
     """
     Clear cached values.
@@ -60,15 +188,14 @@ def clear_cache(prefix: str | None = None) -> None:
         prefix: If provided, only clear cache keys starting with this prefix.
                 If None, clear all cache.
     """
-    global _cache
-
-    if prefix is None:
-        _cache.clear()
-    else:
-        # Clear only keys with the given prefix
-        keys_to_delete = [key for key in _cache if key.startswith(f"{prefix}:")]
-        for key in keys_to_delete:
-            del _cache[key]
+    with _cache_lock:
+        if prefix is None:
+            _cache.clear()
+        else:
+            # Clear only keys with the given prefix
+            keys_to_delete = [key for key in _cache if key.startswith(f"{prefix}:")]
+            for key in keys_to_delete:
+                del _cache[key]
 
 
 def get_cache_stats() -> dict[str, Any]:
@@ -81,14 +208,18 @@ def get_cache_stats() -> dict[str, Any]:
     now = time.time()
     config = get_tool_config()
 
+    with _cache_lock:
+        cached_times = [cached_time for _, cached_time in _cache.values()]
     valid_entries = sum(
-        1 for _, cached_time in _cache.values() if now - cached_time < config.cache_ttl_seconds
+        1 for cached_time in cached_times if now - cached_time < config.cache_ttl_seconds
     )
 
     return {
-        "total_entries": len(_cache),
+        "total_entries": len(cached_times),
         "valid_entries": valid_entries,
-        "expired_entries": len(_cache) - valid_entries,
+        "expired_entries": len(cached_times) - valid_entries,
+        "max_entries": config.cache_max_entries,
+        "evictions": _evictions,
         "ttl_seconds": config.cache_ttl_seconds,
         "enabled": config.enable_caching,
     }
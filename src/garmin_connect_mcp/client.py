@@ -1,7 +1,16 @@
 """Garmin Connect API client wrapper with error handling."""
 
+import asyncio
+import atexit
+import contextvars
+import functools
+import json
+import math
 import sys
-from collections.abc import Callable
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -12,7 +21,10 @@ from garminconnect import (
     GarminConnectTooManyRequestsError,
 )
 
-from .auth import GarminConfig, get_token_base64_path, get_token_store
+from .auth import GarminConfig, get_capabilities_path, get_token_base64_path, get_token_store
+from .cache import clear_cache, get_or_call
+from .config import get_tool_config
+from .time_utils import get_today_date_string
 
 
 class GarminAPIError(Exception):
@@ -61,7 +73,7 @@ def init_garmin_client(
     Initialize and authenticate Garmin client.
 
     Follows the authentication pattern from the original garmin_mcp project:
-    1. Try token-based login first
+    1. Try token-based login first, from the token directory or else the base64 token file
     2. Fall back to credential-based login with MFA support
     3. Persist tokens for future use
 
@@ -80,17 +92,30 @@ def init_garmin_client(
         try:
             # Check if tokens exist
             token_path = Path(tokenstore)
+            token_base64_path = Path(get_token_base64_path())
             if token_path.exists() and any(token_path.iterdir()):
                 # Try to login with existing tokens
                 garmin = Garmin()
                 garmin.login(tokenstore)
                 print("Logged in using token data from directory.", file=sys.stderr)
                 return garmin
+            elif token_base64_path.is_file():
+                # Restore the token directory from the exported token JSON rather than
+                # repeating the full login handshake. Garmin.login() reads strings of up
+                # to 512 characters as a path, so the tokens are loaded directly and
+                # written to the directory before logging in from it.
+                garmin = Garmin()
+                garmin.client.loads(token_base64_path.read_text().strip())
+                garmin.client.dump(tokenstore)
+                garmin.login(tokenstore)
+                print("Logged in using exported token data.", file=sys.stderr)
+                return garmin
             else:
                 raise FileNotFoundError("No tokens found")
 
         except (
             FileNotFoundError,
+            # Unreadable or incomplete token data, or tokens Garmin no longer accepts
             GarminConnectAuthenticationError,
             GarminConnectConnectionError,
         ) as e:
@@ -108,6 +133,9 @@ def init_garmin_client(
             # Attempt credential-based login.
             garmin.login()
 
+            # Cached responses may belong to the previous session
+            clear_cache("garmin")
+
             # Save tokens for future use
             garmin.client.dump(tokenstore)
             print(f"OAuth tokens saved to directory: {tokenstore}", file=sys.stderr)
@@ -135,11 +163,303 @@ def init_garmin_client(
         return None
 
 
+def _is_outage(error: Exception) -> bool:
+    """Check whether an error means Garmin is unavailable, rather than the request failing."""
+    return isinstance(error, GarminAPIError) and not isinstance(
+        error, GarminNotFoundError | GarminAuthenticationError
+    )
+
+
+def _is_session_expired(error: GarminAuthenticationError) -> bool:
+    """Check whether an auth error means the login is no longer valid."""
+    cause = error.original_error
+    if isinstance(cause, GarminConnectAuthenticationError):
+        return True
+    # A 403 can also mean the account lacks a feature, so only a 401 drops the session
+    error_str = str(cause)
+    return "401" in error_str or "Unauthorized" in error_str
+
+
+# A single Garmin call to dispatch: (result key, client method name, positional args)
+CallSpec = tuple[str, str, tuple[Any, ...]]
+
+# Endpoints backed by optional hardware or account features. A 404 from one of these
+# (before it has ever returned data) means the account can't serve it, so it is skipped
+# on later calls instead of costing a wasted round-trip every time.
+CAPABILITY_ENDPOINTS = frozenset(
+    {
+        "get_spo2_data",
+        "get_respiration_data",
+        "get_hydration_data",
+        "get_floors",
+        "get_blood_pressure",
+        "get_body_composition",
+        "get_training_readiness",
+        "get_training_status",
+        "get_body_battery",
+        "get_body_battery_events",
+    }
+)
+
+# Read-only endpoints whose responses are cached for api_cache_ttl_seconds, so repeated
+# or overlapping tool queries don't re-issue the same request
+CACHEABLE_ENDPOINTS = frozenset(
+    {
+        "get_activities_by_date",
+        "get_daily_weigh_ins",
+        "get_devices",
+        "get_endurance_score",
+        "get_fitness_age",
+        "get_full_name",
+        "get_hill_score",
+        "get_hrv_data",
+        "get_max_metrics",
+        "get_pregnancy_summary",
+        "get_primary_training_device",
+        "get_stats",
+        "get_user_summary",
+        "get_weigh_ins",
+        "get_workout",
+        "get_workouts",
+    }
+)
+
+# Cacheable endpoints whose data changes faster or slower than api_cache_ttl_seconds.
+# The account name is fixed for the session; it is dropped on a credential re-login.
+ENDPOINT_CACHE_TTLS: dict[str, float] = {
+    # Live daily totals and weigh-ins
+    "get_stats": 30,
+    "get_user_summary": 30,
+    "get_daily_weigh_ins": 30,
+    "get_weigh_ins": 30,
+    # Account and device details
+    "get_full_name": math.inf,
+    "get_devices": 3600,
+    "get_primary_training_device": 3600,
+    "get_pregnancy_summary": 3600,
+    # Saved workouts
+    "get_workouts": 60,
+    "get_workout": 300,
+}
+
+# Cached endpoints made stale by a successful call to a write endpoint
+CACHE_INVALIDATIONS: dict[str, tuple[str, ...]] = {
+    "add_weigh_in": ("get_daily_weigh_ins", "get_weigh_ins"),
+    "delete_weigh_ins": ("get_daily_weigh_ins", "get_weigh_ins"),
+    "upload_workout": ("get_workouts",),
+}
+
+
+def _as_list(result: Any) -> list[Any]:
+    """Treat a missing or malformed list response as an empty list."""
+    return result if isinstance(result, list) else []
+
+
+# Endpoints documented to return lists, normalized once here so tools can use the
+# result without re-checking its type
+RESULT_COERCIONS: dict[str, Callable[[Any], Any]] = {
+    "get_activities_by_date": _as_list,
+    "get_workouts": _as_list,
+}
+
+
+# Worker threads for blocking Garmin requests, kept apart from the default executor
+_api_executor: ThreadPoolExecutor | None = None
+_api_executor_lock = threading.Lock()
+
+
+def _get_api_executor() -> ThreadPoolExecutor:
+    """Get the executor for Garmin requests, creating it on first use."""
+    global _api_executor
+    with _api_executor_lock:
+        if _api_executor is None:
+            _api_executor = ThreadPoolExecutor(
+                max_workers=get_tool_config().api_max_workers, thread_name_prefix="garmin"
+            )
+            # Don't start queued Garmin requests once the server is shutting down
+            atexit.register(_api_executor.shutdown, wait=False, cancel_futures=True)
+        return _api_executor
+
+
+async def run_in_api_thread(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking Garmin request on the dedicated API executor.
+
+    Like asyncio.to_thread, the call runs in a copy of the current context, so
+    per-tool state such as stale cache tracking carries over.
+
+    Args:
+        func: Blocking callable to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of func
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(_get_api_executor(), call)
+
+
 class GarminClientWrapper:
     """Wrapper around Garmin client for consistent error handling."""
 
-    def __init__(self, client: Garmin):
+    def __init__(self, client: Garmin, capabilities_path: Path | None = None):
         self.client = client
+        self.capabilities_path = capabilities_path
+        self._supported: set[str] = set()
+        # Unsupported endpoints mapped to the wall-clock time they were found unsupported
+        self._unsupported: dict[str, float] = self._load_unsupported()
+        self._capabilities_lock = threading.Lock()
+        # Caps requests in flight to Garmin across all tools, to avoid 429 retry storms
+        self._request_slots = threading.BoundedSemaphore(
+            get_tool_config().api_max_concurrent_requests
+        )
+
+    def _user_key(self) -> str | None:
+        """Identify the logged-in user for keying persisted capabilities."""
+        display_name = getattr(self.client, "display_name", None)
+        return str(display_name) if display_name else None
+
+    @staticmethod
+    def _is_current(marked_at: float) -> bool:
+        """Check whether an unsupported-endpoint entry is recent enough to trust."""
+        return time.time() - marked_at < get_tool_config().unsupported_endpoint_ttl_seconds
+
+    def _load_unsupported(self) -> dict[str, float]:
+        """Load unexpired endpoints previously recorded as unsupported for this user."""
+        user_key = self._user_key()
+        if self.capabilities_path is None or user_key is None:
+            return {}
+
+        try:
+            stored = json.loads(self.capabilities_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(stored, dict) or not isinstance(stored.get(user_key), dict):
+            return {}
+        return {
+            name: marked_at
+            for name, marked_at in stored[user_key].items()
+            if name in CAPABILITY_ENDPOINTS
+            and isinstance(marked_at, int | float)
+            and self._is_current(marked_at)
+        }
+
+    def _save_unsupported(self) -> None:
+        """Persist unsupported endpoints for this user, keeping other users' entries."""
+        user_key = self._user_key()
+        if self.capabilities_path is None or user_key is None:
+            return
+
+        try:
+            stored = json.loads(self.capabilities_path.read_text())
+            if not isinstance(stored, dict):
+                stored = {}
+        except (OSError, ValueError):
+            stored = {}
+
+        entries = {
+            name: marked_at
+            for name, marked_at in self._unsupported.items()
+            if self._is_current(marked_at)
+        }
+        if entries:
+            stored[user_key] = entries
+        else:
+            stored.pop(user_key, None)
+        try:
+            self.capabilities_path.write_text(json.dumps(stored))
+        except OSError as err:
+            print(f"Could not save endpoint capabilities: {err}", file=sys.stderr)
+
+    def clear_unsupported(self) -> None:
+        """Forget this user's recorded unsupported endpoints, keeping other users' entries."""
+        with self._capabilities_lock:
+            self._unsupported.clear()
+            self._save_unsupported()
+
+    def is_unsupported(self, method_name: str) -> bool:
+        """Check whether an endpoint is known to be unavailable for this account."""
+        marked_at = self._unsupported.get(method_name)
+        return marked_at is not None and self._is_current(marked_at)
+
+    def optional_call(self, method_name: str, *args, **kwargs) -> Any:
+        """
+        Call a Garmin client method whose failure should not fail the whole tool.
+
+        Endpoints already known to be unsupported for this account are skipped without
+        a network request. A 404 from a capability endpoint that has never returned data
+        marks it as unsupported for future calls, until the entry expires after
+        unsupported_endpoint_ttl_seconds.
+
+        Args:
+            method_name: Name of the Garmin client method to call
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            Method result, or None if the endpoint is unsupported or the call failed
+        """
+        if self.is_unsupported(method_name):
+            return None
+
+        try:
+            result = self._safe_call(method_name, *args, **kwargs)
+        except GarminNotFoundError:
+            if method_name in CAPABILITY_ENDPOINTS:
+                with self._capabilities_lock:
+                    if method_name not in self._supported:
+                        self._unsupported[method_name] = time.time()
+                        self._save_unsupported()
+            return None
+        except GarminAPIError:
+            return None
+
+        if result:
+            with self._capabilities_lock:
+                self._supported.add(method_name)
+        return result
+
+    async def _timed_optional_call(
+        self, method_name: str, args: tuple[Any, ...], timeout: float
+    ) -> Any:
+        """Run an optional call in a worker thread, giving up on it after timeout seconds."""
+        try:
+            async with asyncio.timeout(timeout):
+                return await run_in_api_thread(self.optional_call, method_name, *args)
+        except TimeoutError:
+            return None
+
+    async def gather_optional(
+        self, specs: Sequence[CallSpec], max_concurrency: int | None = None
+    ) -> dict[str, Any]:
+        """
+        Run several optional calls concurrently on the API executor.
+
+        Each call is bounded by the optional_call_timeout_seconds setting, so one slow
+        endpoint can't hold up the whole response.
+
+        Args:
+            specs: Calls to dispatch as (result key, method name, args) tuples
+            max_concurrency: Maximum number of calls in flight at once (unbounded if None)
+
+        Returns:
+            Dict mapping each result key to its result, or None if that call failed or
+            timed out
+        """
+        timeout = get_tool_config().optional_call_timeout_seconds
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def run(method_name: str, args: tuple[Any, ...]) -> Any:
+            if semaphore is None:
+                return await self._timed_optional_call(method_name, args, timeout)
+            async with semaphore:
+                return await self._timed_optional_call(method_name, args, timeout)
+
+        results = await asyncio.gather(*(run(method_name, args) for _, method_name, args in specs))
+        return dict(zip((key for key, _, _ in specs), results, strict=True))
 
     def safe_call(self, method_name: str, *args, **kwargs) -> Any:
         """
@@ -149,6 +469,12 @@ class GarminClientWrapper:
         to the external garminconnect library, which doesn't have type stubs. The actual
         return type depends on which Garmin API method is called.
 
+        Responses from CACHEABLE_ENDPOINTS are served from the shared cache while fresh,
+        and write endpoints clear the cached responses they make stale. If Garmin is
+        unavailable, a recently expired cached response is returned instead of an error.
+
+        An expired login on the shared client drops it so the next tool call logs in again.
+
         Args:
             method_name: Name of the Garmin client method to call
             *args: Positional arguments for the method
@@ -163,9 +489,38 @@ class GarminClientWrapper:
             GarminRateLimitError: Rate limit exceeded (429)
             GarminAPIError: Other API errors
         """
+        try:
+            return self._safe_call(method_name, *args, **kwargs)
+        except GarminAuthenticationError as e:
+            # Only the shared client's session backs other tool calls
+            if _is_session_expired(e) and self is peek_shared_wrapper():
+                reset_shared_wrapper()
+            raise
+
+    def _safe_call(self, method_name: str, *args, **kwargs) -> Any:
+        """Call a method through the response cache, leaving the shared client in place."""
+        if method_name in CACHEABLE_ENDPOINTS:
+            config = get_tool_config()
+            if config.enable_caching:
+                return get_or_call(
+                    f"garmin:{method_name}:{args}:{kwargs}",
+                    ENDPOINT_CACHE_TTLS.get(method_name, config.api_cache_ttl_seconds),
+                    lambda: self._call(method_name, *args, **kwargs),
+                    stale_seconds=config.api_cache_stale_seconds,
+                    use_stale=_is_outage,
+                )
+
+        result = self._call(method_name, *args, **kwargs)
+        for stale_method in CACHE_INVALIDATIONS.get(method_name, ()):
+            clear_cache(f"garmin:{stale_method}")
+        return result
+
+    def _call(self, method_name: str, *args, **kwargs) -> Any:
+        """Call a Garmin client method, translating library errors to GarminAPIError."""
         try:
             method = getattr(self.client, method_name)
-            return method(*args, **kwargs)
+            with self._request_slots:
+                result = method(*args, **kwargs)
         except AttributeError as e:
             raise GarminAPIError(
                 f"Method '{method_name}' not found on Garmin client", original_error=e
@@ -187,3 +542,110 @@ class GarminClientWrapper:
                 raise GarminAPIError(f"Garmin API error: {str(e)}", original_error=e) from e
         except Exception as e:
             raise GarminAPIError(f"Unexpected error: {str(e)}", original_error=e) from e
+
+        coerce = RESULT_COERCIONS.get(method_name)
+        return coerce(result) if coerce is not None else result
+
+
+# Process-wide client, created on first use so the login handshake happens once
+_shared_wrapper: GarminClientWrapper | None = None
+_shared_wrapper_lock = threading.Lock()
+
+# Background request warming the cache after login, kept referenced until it finishes
+_prefetch_task: asyncio.Task[dict[str, Any]] | None = None
+
+
+def get_prefetch_specs() -> list[CallSpec]:
+    """Get the requests nearly every session makes, prefetched after login."""
+    return [
+        ("full_name", "get_full_name", ()),
+        ("devices", "get_devices", ()),
+        ("stats", "get_stats", (get_today_date_string(),)),
+    ]
+
+
+def get_shared_wrapper(config: GarminConfig) -> GarminClientWrapper | None:
+    """
+    Get the process-wide Garmin client wrapper, logging in on first use.
+
+    The fast path is lock-free once the wrapper exists. Concurrent first calls are
+    serialized so only one of them logs in.
+
+    Args:
+        config: Garmin configuration with credentials
+
+    Returns:
+        Shared client wrapper, or None if login failed (the next call retries)
+    """
+    global _shared_wrapper
+    wrapper = _shared_wrapper
+    if wrapper is not None:
+        return wrapper
+
+    with _shared_wrapper_lock:
+        if _shared_wrapper is None:
+            client = init_garmin_client(config)
+            if client is None:
+                return None
+            _shared_wrapper = GarminClientWrapper(client, capabilities_path=get_capabilities_path())
+        return _shared_wrapper
+
+
+def peek_shared_wrapper() -> GarminClientWrapper | None:
+    """
+    Get the process-wide Garmin client wrapper if it has already been created.
+
+    Callers can use this to skip loading and validating configuration once logged in.
+
+    Returns:
+        Shared client wrapper, or None if no login has succeeded yet
+    """
+    return _shared_wrapper
+
+
+async def get_shared_wrapper_async(config: GarminConfig) -> GarminClientWrapper | None:
+    """
+    Get the process-wide Garmin client wrapper without blocking the event loop.
+
+    Once the wrapper exists it is returned directly. Otherwise the login runs in a
+    worker thread, and concurrent first callers all wait on the same login. After
+    login, commonly requested endpoints are fetched in the background (see
+    get_prefetch_specs) so the first tool calls are served from the cache.
+
+    Args:
+        config: Garmin configuration with credentials
+
+    Returns:
+        Shared client wrapper, or None if login failed (the next call retries)
+    """
+    global _prefetch_task
+    wrapper = _shared_wrapper
+    if wrapper is not None:
+        return wrapper
+
+    wrapper = await asyncio.to_thread(get_shared_wrapper, config)
+    tool_config = get_tool_config()
+    if (
+        wrapper is not None
+        and _prefetch_task is None
+        and tool_config.enable_caching
+        and tool_config.prefetch_on_login
+    ):
+        _prefetch_task = asyncio.create_task(wrapper.gather_optional(get_prefetch_specs()))
+    return wrapper
+
+
+def reset_shared_wrapper() -> None:
+    """
+    Drop the shared client so the next call logs in again.
+
+    The user's recorded unsupported endpoints are forgotten too, so the fresh login
+    rediscovers what the account can serve.
+    """
+    global _shared_wrapper, _prefetch_task
+    with _shared_wrapper_lock:
+        wrapper = _shared_wrapper
+        _shared_wrapper = None
+        _prefetch_task = None
+    if wrapper is not None:
+        wrapper.clear_unsupported()
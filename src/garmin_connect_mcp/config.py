@@ -9,6 +9,22 @@ class ToolConfig(BaseSettings):
     # Caching settings
     enable_caching: bool = True
     cache_ttl_seconds: int = 3600  # 1 hour default
+    api_cache_ttl_seconds: int = 300  # Read-only Garmin API responses
+    api_cache_stale_seconds: int = 3600  # Max age of cached responses served during outages
+    cache_max_entries: int = 1024  # Least recently used entries are evicted beyond this
+    prefetch_on_login: bool = True  # Warm the cache with common requests after login
+
+    # How long an endpoint that returned 404 for the account is skipped before retrying
+    unsupported_endpoint_ttl_seconds: int = 7 * 24 * 3600  # 1 week
+
+    # Optional API calls that take longer than this are reported as missing data
+    optional_call_timeout_seconds: float = 10.0
+
+    # Worker threads available for blocking Garmin API requests, and how many of them
+    # may have a request in flight to Garmin at once. Workers beyond the request limit
+    # serve cache hits while other workers wait on Garmin.
+    api_max_workers: int = 10
+    api_max_concurrent_requests: int = 4
 
     # Query limits
     default_activity_limit: int = 20
@@ -33,7 +33,7 @@ def format_date(date_str: str | datetime | None) -> str:
 
     if isinstance(date_str, str):
         try:
-            dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+            dt = datetime.fromisoformat(date_str)
             return dt.strftime("%Y-%m-%d")
         except Exception:
             return date_str
@@ -51,7 +51,7 @@ def format_datetime(date_str: str | datetime | None) -> str:
 
     if isinstance(date_str, str):
         try:
-            dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+            dt = datetime.fromisoformat(date_str)
             return dt.strftime("%Y-%m-%d %H:%M:%S")
         except Exception:
             return date_str
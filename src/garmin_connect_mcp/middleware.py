@@ -10,41 +10,43 @@ from fastmcp.exceptions import ToolError
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 
 from .auth import load_config, validate_credentials
-from .client import GarminClientWrapper, init_garmin_client
+from .cache import track_stale_hits
+from .client import get_shared_wrapper_async, peek_shared_wrapper
 
 
 class ConfigMiddleware(Middleware):
     """Middleware that initializes Garmin client for all tool calls.
 
     This middleware:
-    1. Loads the Garmin config from environment variables
-    2. Validates that credentials are properly configured
-    3. Initializes the Garmin client
-    4. Injects the client into the context state for tools to access via ctx.get_state("client")
-    5. Raises ToolError if authentication fails
+    1. Reuses the shared Garmin client if a previous call has already logged in
+    2. Otherwise loads the Garmin config from environment variables, validates that
+       credentials are properly configured, and logs in
+    3. Injects the client into the context state for tools to access via ctx.get_state("client")
+    4. Raises ToolError if authentication fails
     """
 
     async def on_call_tool(self, context: MiddlewareContext, call_next: Callable[..., Any]):
         """Initialize Garmin client before every tool call."""
-        # Load and validate configuration
-        config = load_config()
-
-        if not validate_credentials(config):
-            raise ToolError(
-                "Garmin credentials not configured. "
-                "Please run 'garmin-connect-mcp auth' to set up authentication."
-            )
-
-        # Initialize Garmin client
-        client = init_garmin_client(config)
-        if client is None:
-            raise ToolError(
-                "Failed to initialize Garmin client. "
-                "Please run 'garmin-connect-mcp auth' to authenticate interactively. "
-                "If the problem persists, check your Garmin credentials."
-            )
-
-        client_wrapper = GarminClientWrapper(client)
+        # Once logged in, skip re-reading the env files on every call
+        client_wrapper = peek_shared_wrapper()
+        if client_wrapper is None:
+            # Load and validate configuration
+            config = load_config()
+
+            if not validate_credentials(config):
+                raise ToolError(
+                    "Garmin credentials not configured. "
+                    "Please run 'garmin-connect-mcp auth' to set up authentication."
+                )
+
+            # Get the shared Garmin client (logs in once per process)
+            client_wrapper = await get_shared_wrapper_async(config)
+            if client_wrapper is None:
+                raise ToolError(
+                    "Failed to initialize Garmin client. "
+                    "Please run 'garmin-connect-mcp auth' to authenticate interactively. "
+                    "If the problem persists, check your Garmin credentials."
+                )
 
         # Inject client into context state for tools to access
         if context.fastmcp_context:
@@ -54,5 +56,8 @@ class ConfigMiddleware(Middleware):
                 serializable=False,
             )
 
+        # Let the response note any cached data served during a Garmin outage
+        track_stale_hits()
+
         # Continue to the tool execution
         return await call_next(context)
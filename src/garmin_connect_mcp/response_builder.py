@@ -1,24 +1,141 @@
 """Response builder for structured Garmin Connect MCP responses."""
 
 import json
-from datetime import UTC, datetime
-from typing import Any, cast
+import time
+from datetime import UTC, date, datetime
+from functools import lru_cache
+from typing import Any
 
+from .cache import get_stale_age
+from .config import get_tool_config
 from .pagination import PaginationInfo
 from .types import JSONSerializable, UnitSystem
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "fast" extra
+    orjson = None
 
-def _convert_datetimes(obj: Any) -> Any:  # type: ignore[misc]
-    """Recursively convert datetime objects to ISO strings."""
-    if isinstance(obj, datetime):
+
+def _json_default(obj: Any) -> str:
+    """Encode dates and datetimes as ISO strings, matching orjson's native output."""
+    if isinstance(obj, date):
         return obj.isoformat()
-    elif isinstance(obj, dict):
-        return {str(k): _convert_datetimes(v) for k, v in obj.items()}  # type: ignore[misc]
-    elif isinstance(obj, list):
-        return [_convert_datetimes(item) for item in obj]  # type: ignore[misc]
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# json.dumps builds a new JSONEncoder whenever non-default options are passed, so
+# share one compact encoder across responses. The encoder only calls _json_default
+# for values it can't serialize, so datetimes need no separate pass over the data.
+# Non-ASCII text is left unescaped, as orjson does, which also skips the escape scan.
+_stdlib_encode = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False, default=_json_default
+).encode
+
+
+def _json_key(key: Any) -> Any:
+    """Encode a dict key the way orjson's OPT_NON_STR_KEYS does, else as its str()."""
+    if isinstance(key, date):
+        return key.isoformat()
+    if key is None or isinstance(key, str | int | float):
+        return key
+    return str(key)
+
+
+def _stringify_keys(obj: Any) -> Any:
+    """Recursively convert dict keys the encoders can't handle (e.g. dates, tuples)."""
+    if isinstance(obj, dict):
+        return {_json_key(k): _stringify_keys(v) for k, v in obj.items()}
+    if isinstance(obj, list | tuple):
+        return [_stringify_keys(item) for item in obj]
     return obj
 
 
+def _encode(obj: Any) -> str:
+    """Encode compactly, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return _stdlib_encode(obj)
+
+
+def _encode_json(obj: Any) -> str:
+    """Encode a response, normalising dict keys only if the encoder rejects them."""
+    try:
+        return _encode(obj)
+    except TypeError:
+        # Both encoders then produce the same keys; values that still can't be encoded
+        # raise again
+        return _encode(_stringify_keys(obj))
+
+
+# How long a generated response timestamp is reused before reading the clock again
+_TIMESTAMP_RESOLUTION_SECONDS = 0.05
+
+# (monotonic time it was taken, UTC ISO timestamp), swapped as a whole so threads
+# never see a mismatched pair
+_last_timestamp: tuple[float, str] = (float("-inf"), "")
+
+
+def _utc_timestamp() -> str:
+    """Get the current UTC time as an ISO string, reused for bursts of responses."""
+    global _last_timestamp
+    taken_at, timestamp = _last_timestamp
+    now = time.monotonic()
+    if now - taken_at > _TIMESTAMP_RESOLUTION_SECONDS:
+        timestamp = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+        _last_timestamp = (now, timestamp)
+    return timestamp
+
+
+# Activity timestamps expanded with day-of-week information by format_activity
+_ACTIVITY_DATE_FIELDS = ("startTimeLocal", "startTimeGMT", "endTimeLocal")
+
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+
+def _format_date_fields(parsed_dt: datetime) -> tuple[str, str, str]:
+    """Build the date, day-of-week and human-readable fields for a datetime."""
+    # Build the fixed layouts directly rather than through strftime, which also keeps
+    # day and month names in English regardless of locale
+    day_of_week = _WEEKDAYS[parsed_dt.weekday()]  # e.g., "Monday"
+    hour = parsed_dt.hour % 12 or 12
+    am_pm = "AM" if parsed_dt.hour < 12 else "PM"
+    return (
+        parsed_dt.date().isoformat(),
+        day_of_week,
+        # e.g., "Monday, October 15, 2025 at 02:30 PM"
+        f"{day_of_week}, {_MONTHS[parsed_dt.month - 1]} {parsed_dt.day:02d}, "
+        f"{parsed_dt.year} at {hour:02d}:{parsed_dt.minute:02d} {am_pm}",
+    )
+
+
+@lru_cache(maxsize=4096)
+def _date_fields(iso: str) -> tuple[str, str, str]:
+    """
+    Parse and format an ISO date string once; the same days recur across responses.
+
+    Datetimes are cached by their ISO string rather than by value: aware datetimes for
+    the same instant compare equal across offsets, so keying on the value could return
+    another offset's local date. Activities carry up to three timestamps each, so the
+    cache is sized for several pages of activity lists.
+    """
+    return _format_date_fields(datetime.fromisoformat(iso))
+
+
 class ResponseBuilder:
     """Build structured responses with data, analysis, and metadata."""
 
@@ -44,19 +161,15 @@ class ResponseBuilder:
         if dt is None:
             return None
 
-        # Parse the datetime if it's a string, otherwise use it directly
-        if isinstance(dt, str):
-            parsed_dt = datetime.fromisoformat(dt.replace("Z", "+00:00"))
-        else:
-            parsed_dt = dt
+        iso = dt if isinstance(dt, str) else dt.isoformat()
+        date_str, day_of_week, formatted = _date_fields(iso)
 
+        # Build a fresh dict each time so callers can't mutate the cached fields
         return {
-            "datetime": dt if isinstance(dt, str) else dt.isoformat(),
-            "date": parsed_dt.strftime("%Y-%m-%d"),
-            "day_of_week": parsed_dt.strftime("%A"),  # e.g., "Monday"
-            "formatted": parsed_dt.strftime(
-                "%A, %B %d, %Y at %I:%M %p"
-            ),  # e.g., "Monday, October 15, 2025 at 02:30 PM"
+            "datetime": iso,
+            "date": date_str,
+            "day_of_week": day_of_week,
+            "formatted": formatted,
         }
 
     @staticmethod
@@ -78,32 +191,34 @@ class ResponseBuilder:
         Returns:
             JSON string with structured response
         """
-        # Convert datetime objects to ISO strings
-        converted_data = cast(JSONSerializable, _convert_datetimes(data))
-        converted_analysis: dict[str, Any] | None = None
-        if analysis:
-            converted_analysis = cast(dict[str, Any], _convert_datetimes(analysis))
-
-        response: dict[str, Any] = {"data": converted_data}
+        # Datetimes are encoded as ISO strings by the JSON encoder itself
+        response: dict[str, Any] = {"data": data}
 
-        if converted_analysis:
-            response["analysis"] = converted_analysis
+        if analysis:
+            response["analysis"] = analysis
 
         if pagination:
             response["pagination"] = pagination
 
-        # Build metadata with timestamp
-        meta = metadata or {}
-        converted_meta = cast(dict[str, Any], _convert_datetimes(meta))
-        converted_meta["fetched_at"] = datetime.now(UTC).isoformat().replace("+00:00", "Z")
+        # Build metadata with timestamp, copied so the caller's dict isn't modified
+        meta = dict(metadata or {})
+        meta["fetched_at"] = _utc_timestamp()
 
-        response["metadata"] = converted_meta
+        # Flag responses that include cached data served while Garmin was unavailable
+        stale_age = get_stale_age()
+        if stale_age is not None:
+            meta["cache"] = {"stale": True, "age_s": round(stale_age)}
 
-        return json.dumps(response, separators=(",", ":"))
+        response["metadata"] = meta
+
+        return _encode_json(response)
 
     @staticmethod
     def build_error_response(
-        message: str, error_type: str = "error", suggestions: list[str] | None = None
+        message: str,
+        error_type: str = "error",
+        suggestions: list[str] | None = None,
+        cause: BaseException | None = None,
     ) -> str:
         """
         Build a structured error response.
@@ -112,6 +227,8 @@ class ResponseBuilder:
             message: Error message
             error_type: Type of error (error, warning, etc.)
             suggestions: Optional list of suggestions to resolve the error
+            cause: Optional underlying exception, described in a "detail" field only
+                when include_debug_info is enabled
 
         Returns:
             JSON string with error response
@@ -120,14 +237,18 @@ class ResponseBuilder:
             "error": {
                 "type": error_type,
                 "message": message,
-                "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+                "timestamp": _utc_timestamp(),
             }
         }
 
         if suggestions:
             response["error"]["suggestions"] = suggestions
 
-        return json.dumps(response, separators=(",", ":"))
+        # Only format the underlying exception when it will actually be shown
+        if cause is not None and get_tool_config().include_debug_info:
+            response["error"]["detail"] = f"{type(cause).__name__}: {cause}"
+
+        return _encode_json(response)
 
     @staticmethod
     def format_activity(
@@ -179,11 +300,11 @@ class ResponseBuilder:
             }
 
         # Format dates with day-of-week information
-        for date_field in ["startTimeLocal", "startTimeGMT", "endTimeLocal"]:
-            if date_field in activity_dict and activity_dict[date_field]:
-                formatted[date_field] = ResponseBuilder.format_date_with_day(
-                    activity_dict[date_field]
-                )
+        format_date = ResponseBuilder.format_date_with_day
+        for date_field in _ACTIVITY_DATE_FIELDS:
+            value = activity_dict.get(date_field)
+            if value:
+                formatted[date_field] = format_date(value)
 
         # Format heart rate
         if "averageHR" in activity_dict and activity_dict["averageHR"] is not None:
@@ -220,6 +341,26 @@ class ResponseBuilder:
 
         return formatted
 
+    @staticmethod
+    def format_activities(
+        activities: list[dict[str, Any]], unit: UnitSystem = "metric"
+    ) -> list[dict[str, Any]]:
+        """
+        Format a list of activities with format_activity.
+
+        Date fields shared across the list are parsed once via the module-level date
+        cache, so no per-call cache is needed here.
+
+        Args:
+            activities: Raw activity data dictionaries
+            unit: Unit system ('metric' or 'imperial')
+
+        Returns:
+            Formatted activity dictionaries, in the same order
+        """
+        format_activity = ResponseBuilder.format_activity
+        return [format_activity(activity, unit) for activity in activities]
+
     @staticmethod
     def format_health_metric(
         metric_dict: dict[str, Any], unit: UnitSystem = "metric"
@@ -343,7 +484,7 @@ class ResponseBuilder:
 
         if isinstance(date_str, str):
             try:
-                dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                dt = datetime.fromisoformat(date_str)
                 return dt.strftime("%Y-%m-%d %H:%M:%S")
             except Exception:
                 return date_str
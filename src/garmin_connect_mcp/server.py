@@ -220,18 +220,15 @@ mcp.tool(
 )
 async def athlete_profile_resource() -> str:
     """Provide athlete profile with stats and zones for context-aware clients."""
-    # Resources don't go through middleware, so we initialize client directly
+    # Resources don't go through middleware, so we get the shared client directly
     from .auth import load_config
-    from .client import GarminClientWrapper, init_garmin_client
+    from .client import get_shared_wrapper_async, peek_shared_wrapper
     from .response_builder import ResponseBuilder
 
-    config = load_config()
-    client = init_garmin_client(config)
-    if client is None:
+    wrapper = peek_shared_wrapper() or await get_shared_wrapper_async(load_config())
+    if wrapper is None:
         return ResponseBuilder.build_error_response("Failed to initialize Garmin client")
 
-    wrapper = GarminClientWrapper(client)
-
     # Get basic profile
     full_name = wrapper.safe_call("get_full_name")
     unit_system = wrapper.safe_call("get_unit_system")
@@ -259,16 +256,13 @@ async def athlete_profile_resource() -> str:
 async def training_readiness_resource() -> str:
     """Provide current training readiness, Body Battery, and recovery status."""
     from .auth import load_config
-    from .client import GarminClientWrapper, init_garmin_client
+    from .client import get_shared_wrapper_async, peek_shared_wrapper
     from .response_builder import ResponseBuilder
 
-    config = load_config()
-    client = init_garmin_client(config)
-    if client is None:
+    wrapper = peek_shared_wrapper() or await get_shared_wrapper_async(load_config())
+    if wrapper is None:
         return ResponseBuilder.build_error_response("Failed to initialize Garmin client")
 
-    wrapper = GarminClientWrapper(client)
-
     # Get today's health data
     daily_stats = wrapper.safe_call("get_stats", "today")
 
@@ -287,16 +281,13 @@ async def training_readiness_resource() -> str:
 async def health_today_resource() -> str:
     """Provide today's health snapshot (steps, sleep, stress, HR)."""
     from .auth import load_config
-    from .client import GarminClientWrapper, init_garmin_client
+    from .client import get_shared_wrapper_async, peek_shared_wrapper
     from .response_builder import ResponseBuilder
 
-    config = load_config()
-    client = init_garmin_client(config)
-    if client is None:
+    wrapper = peek_shared_wrapper() or await get_shared_wrapper_async(load_config())
+    if wrapper is None:
         return ResponseBuilder.build_error_response("Failed to initialize Garmin client")
 
-    wrapper = GarminClientWrapper(client)
-
     # Get today's health data
     daily_stats = wrapper.safe_call("get_stats", "today")
 
@@ -1,10 +1,14 @@
 """Time and date utilities for Garmin Connect MCP."""
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Literal
 
 PeriodType = Literal["7d", "30d", "90d", "ytd", "this-week", "this-month", "this-year"]
 
+# Longest start/end date range a per-day query will accept
+MAX_RANGE_DAYS = 366
+
 
 def parse_time_range(period: str) -> tuple[datetime, datetime]:
     """
@@ -126,7 +130,7 @@ def format_date_for_api(dt: datetime) -> str:
     Returns:
         Date string in YYYY-MM-DD format
     """
-    return dt.strftime("%Y-%m-%d")
+    return dt.date().isoformat()
 
 
 def get_week_ranges(start_date: datetime, end_date: datetime) -> list[tuple[datetime, datetime]]:
@@ -165,6 +169,50 @@ def get_week_ranges(start_date: datetime, end_date: datetime) -> list[tuple[date
     return weeks
 
 
+def validate_date_range(
+    start_date: datetime, end_date: datetime, max_days: int = MAX_RANGE_DAYS
+) -> int:
+    """
+    Check that a date range is ordered and no longer than max_days.
+
+    Args:
+        start_date: Range start date
+        end_date: Range end date
+        max_days: Maximum number of days the range may span
+
+    Returns:
+        Number of days in the range, inclusive of both ends
+
+    Raises:
+        ValueError: If the range is inverted or spans more than max_days
+    """
+    span = (end_date - start_date).days
+    if span < 0:
+        raise ValueError("Start date must be before or equal to end date")
+    if span > max_days:
+        raise ValueError(f"Date range spans {span} days. Maximum is {max_days} days.")
+    return span + 1
+
+
+def date_range_strings(start_date: datetime, days: int, offset: int = 0) -> list[str]:
+    """
+    List consecutive dates in YYYY-MM-DD format.
+
+    Dates are stepped by ordinal rather than by repeated timedelta addition, which keeps
+    large ranges cheap to generate.
+
+    Args:
+        start_date: First date of the range
+        days: Number of dates to generate
+        offset: Number of days after start_date to begin at
+
+    Returns:
+        List of date strings
+    """
+    first = start_date.toordinal() + offset
+    return [date.fromordinal(ordinal).isoformat() for ordinal in range(first, first + days)]
+
+
 def get_today_date_string() -> str:
     """
     Get today's date as a string in YYYY-MM-DD format.
@@ -172,7 +220,7 @@ def get_today_date_string() -> str:
     Returns:
         Today's date string
     """
-    return datetime.now().strftime("%Y-%m-%d")
+    return date.today().isoformat()
 
 
 def parse_date_string(date_str: str) -> datetime:
@@ -217,3 +265,29 @@ def parse_date_string(date_str: str) -> datetime:
         raise ValueError(
             f"Invalid date format: {date_str}. Use 'today', 'yesterday', or 'YYYY-MM-DD'"
         ) from e
+
+
+def resolve_date(date_str: str | None = None, default: str = "today") -> str:
+    """
+    Resolve a date parameter to a YYYY-MM-DD string, falling back to a default.
+
+    Results are cached per calendar day, so repeated "today"/"yesterday" lookups
+    skip parsing and still roll over at midnight.
+
+    Args:
+        date_str: Date string in any format accepted by parse_date_string, or None
+        default: Date string to use when date_str is empty
+
+    Returns:
+        Date string in YYYY-MM-DD format
+
+    Raises:
+        ValueError: If date string format is invalid
+    """
+    return _resolve_date_for_day(date_str or default, date.today().toordinal())
+
+
+@lru_cache(maxsize=256)
+def _resolve_date_for_day(date_str: str, day_ordinal: int) -> str:
+    """Resolve a date string; day_ordinal scopes cached entries to the current day."""
+    return format_date_for_api(parse_date_string(date_str))
@@ -0,0 +1,60 @@
+"""Shared helpers for Garmin Connect MCP tools."""
+
+from collections.abc import Awaitable, Callable
+from functools import wraps
+
+from fastmcp import Context
+
+from ..client import GarminAPIError, GarminClientWrapper
+from ..config import get_tool_config
+from ..response_builder import ResponseBuilder
+
+ToolFunc = Callable[..., Awaitable[str]]
+
+INTERNAL_ERROR_MESSAGE = "An unexpected error occurred while running the tool"
+
+
+async def get_client(ctx: Context | None) -> GarminClientWrapper:
+    """
+    Get the Garmin client injected into the context by ConfigMiddleware.
+
+    Raises:
+        RuntimeError: If the tool ran without a context or without the middleware
+    """
+    client = await ctx.get_state("client") if ctx is not None else None
+    if client is None:
+        raise RuntimeError("Garmin client not initialized")
+    return client
+
+
+def garmin_tool(*api_error_suggestions: str) -> Callable[[ToolFunc], ToolFunc]:
+    """
+    Turn errors raised by a tool into structured error responses.
+
+    Garmin API errors become "api_error" responses and anything else becomes an
+    "internal_error" response, so tool bodies only need the happy path. Unexpected
+    errors are only described to the client when verbose_errors is enabled.
+
+    Args:
+        *api_error_suggestions: Suggestions to include with Garmin API errors
+
+    Returns:
+        Decorator for an async tool function returning a JSON response
+    """
+
+    def decorator(func: ToolFunc) -> ToolFunc:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> str:
+            try:
+                return await func(*args, **kwargs)
+            except GarminAPIError as e:
+                return ResponseBuilder.build_error_response(
+                    e.message, "api_error", list(api_error_suggestions) or None, e.original_error
+                )
+            except Exception as e:
+                message = str(e) if get_tool_config().verbose_errors else INTERNAL_ERROR_MESSAGE
+                return ResponseBuilder.build_error_response(message, "internal_error", cause=e)
+
+        return wrapper
+
+    return decorator
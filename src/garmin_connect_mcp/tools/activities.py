@@ -90,7 +90,7 @@ async def _query_activities_paginated(
         )
 
     # Format activities
-    formatted_activities = [ResponseBuilder.format_activity(act, unit) for act in activities]
+    formatted_activities = ResponseBuilder.format_activities(activities, unit)
 
     # Aggregate metrics
     aggregated = ResponseBuilder.aggregate_activities(activities, unit)
@@ -174,7 +174,7 @@ async def _query_activities_general_paginated(
         )
 
     # Format activities
-    formatted_activities = [ResponseBuilder.format_activity(act, unit) for act in activities]
+    formatted_activities = ResponseBuilder.format_activities(activities, unit)
 
     # Aggregate metrics
     aggregated = ResponseBuilder.aggregate_activities(activities, unit)
@@ -320,9 +320,7 @@ async def query_activities(
                     analysis={"insights": [f"No activities found{type_msg} for {date_str}"]},
                 )
 
-            formatted_activities = [
-                ResponseBuilder.format_activity(act, unit) for act in activities
-            ]
+            formatted_activities = ResponseBuilder.format_activities(activities, unit)
 
             # Aggregate metrics
             aggregated = ResponseBuilder.aggregate_activities(activities, unit)
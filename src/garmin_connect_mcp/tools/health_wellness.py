@@ -1,14 +1,13 @@
 """Health and wellness tools for Garmin Connect MCP server."""
 
-from datetime import timedelta
 from typing import Annotated, Any
 
 from fastmcp import Context
 
-from ..client import GarminAPIError
+from ..client import CallSpec, GarminAPIError
 from ..pagination import build_pagination_info, decode_cursor
 from ..response_builder import ResponseBuilder
-from ..time_utils import parse_date_string
+from ..time_utils import date_range_strings, parse_date_string, validate_date_range
 from ..types import UnitSystem
 
 
@@ -107,21 +106,16 @@ async def query_health_summary(
         elif start_date and end_date:
             start = parse_date_string(start_date)
             end = parse_date_string(end_date)
-            # Generate all dates in range
-            all_dates = []
-            current = start
-            while current <= end:
-                all_dates.append(current.strftime("%Y-%m-%d"))
-                current += timedelta(days=1)
-
-            # Apply pagination
-            offset = (current_page - 1) * limit
-            fetch_limit = limit + 1
-            dates = all_dates[offset : offset + fetch_limit]
+            try:
+                total_days = validate_date_range(start, end)
+            except ValueError as e:
+                return ResponseBuilder.build_error_response(str(e), error_type="validation_error")
 
-            # Check if there are more pages
-            has_more = len(dates) > limit
-            dates = dates[:limit]
+            # Apply pagination, generating only the dates on the requested page
+            offset = (current_page - 1) * limit
+            page_end = min(offset + limit, total_days)
+            dates = date_range_strings(start, page_end - offset, offset)
+            has_more = page_end < total_days
 
             is_range = True
         else:
@@ -130,56 +124,24 @@ async def query_health_summary(
             dates = [date_str]
             is_range = False
 
-        # Collect data for each date
+        # Collect data for each date, fetching the enabled sections concurrently
         summaries = []
         for date_str in dates:
-            summary = {"date": ResponseBuilder.format_date_with_day(date_str)}
-
-            # Get base stats
-            try:
-                stats = client.safe_call("get_stats", date_str)
-                summary["stats"] = stats
-            except Exception:
-                summary["stats"] = None
-
-            # Get user summary
-            try:
-                user_summary = client.safe_call("get_user_summary", date_str)
-                summary["user_summary"] = user_summary
-            except Exception:
-                summary["user_summary"] = None
-
-            # Training readiness
+            specs: list[CallSpec] = [
+                ("stats", "get_stats", (date_str,)),
+                ("user_summary", "get_user_summary", (date_str,)),
+            ]
             if include_training_readiness:
-                try:
-                    readiness = client.safe_call("get_training_readiness", date_str)
-                    summary["training_readiness"] = readiness
-                except Exception:
-                    summary["training_readiness"] = None
-
-            # Training status
+                specs.append(("training_readiness", "get_training_readiness", (date_str,)))
             if include_training_status:
-                try:
-                    status = client.safe_call("get_training_status", date_str)
-                    summary["training_status"] = status
-                except Exception:
-                    summary["training_status"] = None
-
-            # Body battery
+                specs.append(("training_status", "get_training_status", (date_str,)))
             if include_body_battery:
-                try:
-                    # Body battery typically needs a range
-                    bb = client.safe_call("get_body_battery", date_str, date_str)
-                    summary["body_battery"] = bb
-                except Exception:
-                    summary["body_battery"] = None
-
-                try:
-                    bb_events = client.safe_call("get_body_battery_events", date_str)
-                    summary["body_battery_events"] = bb_events
-                except Exception:
-                    summary["body_battery_events"] = None
+                # Body battery typically needs a range
+                specs.append(("body_battery", "get_body_battery", (date_str, date_str)))
+                specs.append(("body_battery_events", "get_body_battery_events", (date_str,)))
 
+            summary: dict[str, Any] = {"date": ResponseBuilder.format_date_with_day(date_str)}
+            summary.update(await client.gather_optional(specs))
             summaries.append(summary)
 
         # Build insights
@@ -213,7 +175,11 @@ async def query_health_summary(
             return ResponseBuilder.build_response(
                 data={"summaries": summaries, "count": len(summaries)},
                 analysis={"insights": insights} if insights else None,
-                metadata={"start_date": dates[0], "end_date": dates[-1], "unit": unit},
+                metadata={
+                    "start_date": dates[0] if dates else None,
+                    "end_date": dates[-1] if dates else None,
+                    "unit": unit,
+                },
                 pagination=pagination,
             )
         else:
@@ -260,11 +226,11 @@ async def query_sleep_data(
         elif start_date and end_date:
             start = parse_date_string(start_date)
             end = parse_date_string(end_date)
-            dates = []
-            current = start
-            while current <= end:
-                dates.append(current.strftime("%Y-%m-%d"))
-                current += timedelta(days=1)
+            try:
+                total_days = validate_date_range(start, end)
+            except ValueError as e:
+                return ResponseBuilder.build_error_response(str(e), error_type="validation_error")
+            dates = date_range_strings(start, total_days)
             is_range = True
         else:
             # Default to last night (yesterday's date)
@@ -368,11 +334,11 @@ async def query_heart_rate_data(
         elif start_date and end_date:
             start = parse_date_string(start_date)
             end = parse_date_string(end_date)
-            dates = []
-            current = start
-            while current <= end:
-                dates.append(current.strftime("%Y-%m-%d"))
-                current += timedelta(days=1)
+            try:
+                total_days = validate_date_range(start, end)
+            except ValueError as e:
+                return ResponseBuilder.build_error_response(str(e), error_type="validation_error")
+            dates = date_range_strings(start, total_days)
             is_range = True
         else:
             # Default to today
@@ -472,11 +438,11 @@ async def query_activity_metrics(
         elif start_date and end_date:
             start = parse_date_string(start_date)
             end = parse_date_string(end_date)
-            dates = []
-            current = start
-            while current <= end:
-                dates.append(current.strftime("%Y-%m-%d"))
-                current += timedelta(days=1)
+            try:
+                total_days = validate_date_range(start, end)
+            except ValueError as e:
+                return ResponseBuilder.build_error_response(str(e), error_type="validation_error")
+            dates = date_range_strings(start, total_days)
             is_range = True
         else:
             # Default to today
@@ -491,82 +457,50 @@ async def query_activity_metrics(
 
             # Steps
             if "steps" in requested_metrics:
-                try:
-                    steps = client.safe_call("get_steps_data", date_str)
-                    entry["steps"] = steps
-                except Exception:
-                    entry["steps"] = None
+                entry["steps"] = client.optional_call("get_steps_data", date_str)
 
             # Stress
             if "stress" in requested_metrics:
-                try:
-                    stress = client.safe_call("get_stress_data", date_str)
-                    entry["stress"] = stress
-                except Exception:
-                    entry["stress"] = None
+                entry["stress"] = client.optional_call("get_stress_data", date_str)
 
             # Respiration
             if "respiration" in requested_metrics:
-                try:
-                    respiration = client.safe_call("get_respiration_data", date_str)
-                    entry["respiration"] = respiration
-                except Exception:
-                    entry["respiration"] = None
+                entry["respiration"] = client.optional_call("get_respiration_data", date_str)
 
             # SpO2
             if "spo2" in requested_metrics:
-                try:
-                    spo2 = client.safe_call("get_spo2_data", date_str)
-                    entry["spo2"] = spo2
-                except Exception:
-                    entry["spo2"] = None
+                entry["spo2"] = client.optional_call("get_spo2_data", date_str)
 
             # Floors
             if "floors" in requested_metrics:
-                try:
-                    floors = client.safe_call("get_floors", date_str)
-                    entry["floors"] = floors
-                except Exception:
-                    entry["floors"] = None
+                entry["floors"] = client.optional_call("get_floors", date_str)
 
             # Hydration
             if "hydration" in requested_metrics:
-                try:
-                    hydration = client.safe_call("get_hydration_data", date_str)
-                    entry["hydration"] = hydration
-                except Exception:
-                    entry["hydration"] = None
+                entry["hydration"] = client.optional_call("get_hydration_data", date_str)
 
             metrics_data.append(entry)
 
         # Handle range-based metrics
         if is_range and dates:
             # Blood pressure (range only)
-            if "blood_pressure" in requested_metrics:
-                try:
-                    bp = client.safe_call("get_blood_pressure", dates[0], dates[-1])
-                    # Add to first entry or create separate field
-                    if metrics_data:
-                        metrics_data[0]["blood_pressure"] = bp
-                except Exception:
-                    pass
+            if "blood_pressure" in requested_metrics and metrics_data:
+                bp = client.optional_call("get_blood_pressure", dates[0], dates[-1])
+                # Add to first entry or create separate field
+                if bp is not None:
+                    metrics_data[0]["blood_pressure"] = bp
 
             # Body composition (range only)
-            if "body_composition" in requested_metrics:
-                try:
-                    bc = client.safe_call("get_body_composition", dates[0], dates[-1])
-                    if metrics_data:
-                        metrics_data[0]["body_composition"] = bc
-                except Exception:
-                    pass
+            if "body_composition" in requested_metrics and metrics_data:
+                bc = client.optional_call("get_body_composition", dates[0], dates[-1])
+                if bc is not None:
+                    metrics_data[0]["body_composition"] = bc
 
         # Generate insights
         insights = []
         insights.append(f"Requested metrics: {', '.join(requested_metrics)}")
         if len(metrics_data) == 1:
-            available = [
-                k for k in metrics_data[0].keys() if k != "date" and metrics_data[0][k] is not None
-            ]
+            available = [m for m in requested_metrics if metrics_data[0].get(m) is not None]
             if available:
                 insights.append(f"Available metrics: {', '.join(available)}")
         else:
@@ -1,16 +1,16 @@
 """Training and performance tools for Garmin Connect MCP server."""
 
-from collections import defaultdict
 from datetime import datetime
 from typing import Annotated, Any
 
 from fastmcp import Context
 
-from ..client import GarminAPIError
+from ..client import CallSpec, GarminAPIError
 from ..response_builder import ResponseBuilder
 from ..time_utils import (
     format_date_for_api,
     get_range_description,
+    get_today_date_string,
     get_week_ranges,
     parse_time_range,
 )
@@ -25,6 +25,7 @@ async def analyze_training_period(
         str, "Filter by activity type (e.g., 'running', 'cycling'). Empty for all."
     ] = "",
     unit: Annotated[UnitSystem, "Unit system: 'metric' or 'imperial'"] = "metric",
+    include_weekly: Annotated[bool, "Include weekly trends breakdown"] = True,
     ctx: Context | None = None,
 ) -> str:
     """
@@ -33,7 +34,7 @@ async def analyze_training_period(
     Provides:
     - Total volume (activities, distance, time, elevation)
     - Activity type breakdown
-    - Weekly trends
+    - Weekly trends (optional)
     - Performance insights
 
     Example periods: "30d", "this-month", "2024-01-01:2024-01-31"
@@ -50,7 +51,14 @@ async def analyze_training_period(
         start_str = format_date_for_api(start_date)
         end_str = format_date_for_api(end_date)
 
-        activities = client.safe_call("get_activities_by_date", start_str, end_str, activity_type)
+        # A period starting in the future can't contain activities, so skip the request
+        is_future = start_date > datetime.now()
+        if is_future:
+            activities = []
+        else:
+            activities = client.safe_call(
+                "get_activities_by_date", start_str, end_str, activity_type
+            )
 
         if not activities or len(activities) == 0:
             return ResponseBuilder.build_response(
@@ -65,66 +73,92 @@ async def analyze_training_period(
                         "total_activities": 0,
                     },
                 },
-                analysis={"insights": ["No activities found in this period"]},
+                analysis={
+                    "insights": [
+                        "Period is entirely in the future"
+                        if is_future
+                        else "No activities found in this period"
+                    ]
+                },
                 metadata={"period": period, "activity_type": activity_type or "all"},
             )
 
-        # Calculate summary metrics
-        total_distance = sum(act.get("distance", 0) or 0 for act in activities)
-        total_time = sum(act.get("duration", 0) or 0 for act in activities)
-        total_elevation = sum(act.get("elevationGain", 0) or 0 for act in activities)
-
-        # Group by activity type
-        by_type: dict[str, Any] = defaultdict(lambda: {"count": 0, "distance": 0, "time": 0})
+        # Weeks run Monday to Sunday (the first is clamped to the period start), so an
+        # activity's week is its day ordinal's offset from the first Monday, in weeks
+        weeks = get_week_ranges(start_date, end_date) if include_weekly else []
+        start_ord = start_date.toordinal()
+        end_ord = end_date.toordinal()
+        first_monday_ord = start_ord - start_date.weekday()
+
+        # Calculate summary metrics, per-type and per-week totals in a single pass.
+        # Per-type and per-week rows are [count, distance, time].
+        total_distance = total_time = total_elevation = 0
+        by_type: dict[str, list[Any]] = {}
+        by_week: list[list[Any]] = [[0, 0, 0] for _ in weeks]
         for act in activities:
-            act_type = act.get("activityType", {}).get("typeKey", "unknown")
-            by_type[act_type]["count"] += 1
-            by_type[act_type]["distance"] += act.get("distance", 0) or 0
-            by_type[act_type]["time"] += act.get("duration", 0) or 0
-
-        # Format by_type for output
+            distance = act.get("distance", 0) or 0
+            duration = act.get("duration", 0) or 0
+            total_distance += distance
+            total_time += duration
+            total_elevation += act.get("elevationGain", 0) or 0
+
+            type_key = act.get("activityType", {}).get("typeKey", "unknown")
+            row = by_type.get(type_key)
+            if row is None:
+                row = by_type[type_key] = [0, 0, 0]
+            row[0] += 1
+            row[1] += distance
+            row[2] += duration
+
+            if include_weekly:
+                # Activities with a missing or unparseable start time are left out of
+                # the weekly breakdown
+                try:
+                    day_ord = datetime.fromisoformat(act["startTimeLocal"][:10]).toordinal()
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if start_ord <= day_ord <= end_ord:
+                    row = by_week[(day_ord - first_monday_ord) // 7]
+                    row[0] += 1
+                    row[1] += distance
+                    row[2] += duration
+
+        # Format by_type for output, most frequent type first
+        percent_per_activity = 100.0 / len(activities)
+        if len(by_type) == 1:
+            # A single type (e.g. a runners-only period) needs no ordering
+            by_type_items = list(by_type.items())
+        else:
+            by_type_items = sorted(by_type.items(), key=lambda x: -x[1][0])
         by_type_list = []
-        for type_key, data in sorted(by_type.items(), key=lambda x: x[1]["count"], reverse=True):
-            percentage = (data["count"] / len(activities) * 100) if activities else 0
+        for type_key, (count, distance, duration) in by_type_items:
+            percentage = count * percent_per_activity
             by_type_list.append(
                 {
                     "type": type_key,
-                    "count": data["count"],
+                    "count": count,
                     "percentage": round(percentage, 1),
                     "distance": {
-                        "meters": data["distance"],
-                        "formatted": ResponseBuilder._format_distance(data["distance"], unit),
+                        "meters": distance,
+                        "formatted": ResponseBuilder._format_distance(distance, unit),
                     },
                     "time": {
-                        "seconds": data["time"],
-                        "formatted": ResponseBuilder._format_duration(data["time"]),
+                        "seconds": duration,
+                        "formatted": ResponseBuilder._format_duration(duration),
                     },
                 }
             )
 
         # Weekly breakdown
-        weeks = get_week_ranges(start_date, end_date)
         weekly_trends = []
-
-        for week_start, week_end in weeks:
-            week_start_str = format_date_for_api(week_start)
-            week_end_str = format_date_for_api(week_end)
-
-            # Filter activities for this week
-            week_activities = [
-                act
-                for act in activities
-                if week_start_str <= act.get("startTimeLocal", "")[:10] <= week_end_str
-            ]
-
-            week_distance = sum(act.get("distance", 0) or 0 for act in week_activities)
-            week_time = sum(act.get("duration", 0) or 0 for act in week_activities)
-
+        for (week_start, week_end), (week_count, week_distance, week_time) in zip(
+            weeks, by_week, strict=True
+        ):
             weekly_trends.append(
                 {
                     "week_start": ResponseBuilder.format_date_with_day(week_start),
                     "week_end": ResponseBuilder.format_date_with_day(week_end),
-                    "activities": len(week_activities),
+                    "activities": week_count,
                     "distance": {
                         "meters": week_distance,
                         "formatted": ResponseBuilder._format_distance(week_distance, unit),
@@ -138,7 +172,7 @@ async def analyze_training_period(
 
         # Build data structure
         days_in_period = (end_date - start_date).days + 1
-        data = {
+        data: dict[str, Any] = {
             "period": {
                 "description": period_description,
                 "start_date": start_str,
@@ -172,8 +206,9 @@ async def analyze_training_period(
                 },
             },
             "by_activity_type": by_type_list,
-            "trends": {"weekly": weekly_trends},
         }
+        if include_weekly:
+            data["trends"] = {"weekly": weekly_trends}
 
         # Generate insights
         insights = []
@@ -268,70 +303,42 @@ async def get_performance_metrics(
         else:
             # Default to today
             is_range = False
-            query_date = datetime.now().strftime("%Y-%m-%d")
-
-        metrics_data: dict[str, Any] = {}
+            query_date = get_today_date_string()
 
-        # Single-date metrics
+        # Fetch the enabled metrics concurrently; a failed metric is reported as None
+        specs: list[CallSpec] = []
         if not is_range:
-            # VO2 max (max metrics)
+            # Single-date metrics
             if include_vo2_max:
-                try:
-                    vo2_max = client.safe_call("get_max_metrics", query_date)
-                    metrics_data["vo2_max"] = vo2_max
-                except Exception:
-                    metrics_data["vo2_max"] = None
-
-            # HRV
+                specs.append(("vo2_max", "get_max_metrics", (query_date,)))
             if include_hrv:
-                try:
-                    hrv = client.safe_call("get_hrv_data", query_date)
-                    metrics_data["hrv"] = hrv
-                except Exception:
-                    metrics_data["hrv"] = None
-
-            # Fitness age
+                specs.append(("hrv", "get_hrv_data", (query_date,)))
             if include_fitness_age:
-                try:
-                    fitness_age = client.safe_call("get_fitness_age", query_date)
-                    metrics_data["fitness_age"] = fitness_age
-                except Exception:
-                    metrics_data["fitness_age"] = None
+                specs.append(("fitness_age", "get_fitness_age", (query_date,)))
 
             metadata = {"date": query_date}
         else:
             # Range metrics
-            # Hill score
             if include_hill_score:
-                try:
-                    hill_score = client.safe_call("get_hill_score", query_start, query_end)
-                    metrics_data["hill_score"] = hill_score
-                except Exception:
-                    metrics_data["hill_score"] = None
-
-            # Endurance score
+                specs.append(("hill_score", "get_hill_score", (query_start, query_end)))
             if include_endurance_score:
-                try:
-                    endurance_score = client.safe_call(
-                        "get_endurance_score", query_start, query_end
-                    )
-                    metrics_data["endurance_score"] = endurance_score
-                except Exception:
-                    metrics_data["endurance_score"] = None
+                specs.append(("endurance_score", "get_endurance_score", (query_start, query_end)))
 
             metadata = {"start_date": query_start, "end_date": query_end}
 
+        metrics_data = await client.gather_optional(specs)
+
         # Generate insights
-        insights = []
         available_metrics = [k for k, v in metrics_data.items() if v is not None]
-        if available_metrics:
-            insights.append(f"Available performance metrics: {', '.join(available_metrics)}")
-        else:
-            insights.append("No performance metrics available for this period")
+        insights = (
+            [f"Available performance metrics: {', '.join(available_metrics)}"]
+            if available_metrics
+            else ["No performance metrics available for this period"]
+        )
 
         return ResponseBuilder.build_response(
             data=metrics_data,
-            analysis={"insights": insights} if insights else None,
+            analysis={"insights": insights},
             metadata=metadata,
         )
 
@@ -1,14 +1,23 @@
 """Women's health tools for Garmin Connect MCP server."""
 
-from typing import Annotated
+from typing import Annotated, Literal
 
 from fastmcp import Context
 
-from ..client import GarminAPIError
 from ..response_builder import ResponseBuilder
-from ..time_utils import parse_date_string
+from ..time_utils import (
+    date_range_strings,
+    parse_date_string,
+    resolve_date,
+    validate_date_range,
+)
+from ._common import garmin_tool, get_client
 
+# Per-day menstrual requests allowed in flight at once, to stay clear of rate limits
+DAILY_FETCH_CONCURRENCY = 5
 
+
+@garmin_tool()
 async def query_womens_health(
     data_type: Annotated[str, "Data type: 'pregnancy' or 'menstrual'"],
     date: Annotated[str | None, "Specific date (YYYY-MM-DD)"] = None,
@@ -16,6 +25,10 @@ async def query_womens_health(
         str | None, "Range start date (YYYY-MM-DD, for menstrual calendar)"
     ] = None,
     end_date: Annotated[str | None, "Range end date (YYYY-MM-DD, for menstrual calendar)"] = None,
+    granularity: Annotated[
+        Literal["calendar", "daily"],
+        "Menstrual range detail: 'calendar' summary or 'daily' per-day data",
+    ] = "calendar",
     ctx: Context | None = None,
 ) -> str:
     """
@@ -24,65 +37,91 @@ async def query_womens_health(
     Data types:
     - pregnancy: Get pregnancy tracking summary
     - menstrual: Get menstrual cycle data (for specific date or date range)
+
+    Menstrual date ranges return the calendar summary by default, or per-day data
+    for every date in the range with granularity="daily".
     """
-    assert ctx is not None
-    try:
-        client = await ctx.get_state("client")
+    # FastMCP rejects unknown granularities against the Literal; this guards direct callers
+    if granularity not in ("calendar", "daily"):
+        return ResponseBuilder.build_error_response(
+            f"Invalid granularity: {granularity}",
+            "invalid_parameters",
+            ["Valid granularities: 'calendar', 'daily'"],
+        )
+
+    client = await get_client(ctx)
 
-        if data_type == "pregnancy":
-            # Pregnancy summary
-            summary = client.safe_call("get_pregnancy_summary")
+    if data_type == "pregnancy":
+        # Pregnancy summary
+        summary = client.safe_call("get_pregnancy_summary")
+        return ResponseBuilder.build_response(
+            data={"pregnancy_summary": summary},
+            metadata={"data_type": "pregnancy"},
+        )
+
+    elif data_type == "menstrual":
+        # Menstrual data
+        if date:
+            # Specific date
+            date_str = resolve_date(date)
+            menstrual_data = client.safe_call("get_menstrual_data_for_date", date_str)
             return ResponseBuilder.build_response(
-                data={"pregnancy_summary": summary},
-                metadata={"data_type": "pregnancy"},
+                data={"menstrual_data": menstrual_data, "date": date_str},
+                metadata={
+                    "data_type": "menstrual",
+                    "query_type": "single_date",
+                    "date": date_str,
+                },
             )
+        elif start_date and end_date and granularity == "daily":
+            # Date range (per-day data, fetched concurrently)
+            start = parse_date_string(start_date)
+            try:
+                total_days = validate_date_range(start, parse_date_string(end_date))
+            except ValueError as e:
+                return ResponseBuilder.build_error_response(str(e), error_type="validation_error")
 
-        elif data_type == "menstrual":
-            # Menstrual data
-            if date:
-                # Specific date
-                date_str = parse_date_string(date).strftime("%Y-%m-%d")
-                menstrual_data = client.safe_call("get_menstrual_data_for_date", date_str)
-                return ResponseBuilder.build_response(
-                    data={"menstrual_data": menstrual_data, "date": date_str},
-                    metadata={
-                        "data_type": "menstrual",
-                        "query_type": "single_date",
-                        "date": date_str,
-                    },
-                )
-            elif start_date and end_date:
-                # Date range (calendar)
-                calendar_data = client.safe_call(
-                    "get_menstrual_calendar_data", start_date, end_date
-                )
-                return ResponseBuilder.build_response(
-                    data={"menstrual_calendar": calendar_data},
-                    metadata={
-                        "data_type": "menstrual",
-                        "query_type": "calendar",
-                        "start_date": start_date,
-                        "end_date": end_date,
-                    },
-                )
-            else:
-                return ResponseBuilder.build_error_response(
-                    "Date or date range required for menstrual data",
-                    "invalid_parameters",
-                    [
-                        "Provide date for single day",
-                        "Or provide start_date and end_date for calendar view",
-                    ],
-                )
-
+            dates = date_range_strings(start, total_days)
+            daily_data = await client.gather_optional(
+                [(d, "get_menstrual_data_for_date", (d,)) for d in dates],
+                max_concurrency=DAILY_FETCH_CONCURRENCY,
+            )
+            return ResponseBuilder.build_response(
+                data={
+                    "menstrual_days": [{"date": d, "menstrual_data": daily_data[d]} for d in dates],
+                },
+                metadata={
+                    "data_type": "menstrual",
+                    "query_type": "daily",
+                    "start_date": start_date,
+                    "end_date": end_date,
+                },
+            )
+        elif start_date and end_date:
+            # Date range (calendar)
+            calendar_data = client.safe_call("get_menstrual_calendar_data", start_date, end_date)
+            return ResponseBuilder.build_response(
+                data={"menstrual_calendar": calendar_data},
+                metadata={
+                    "data_type": "menstrual",
+                    "query_type": "calendar",
+                    "start_date": start_date,
+                    "end_date": end_date,
+                },
+            )
         else:
             return ResponseBuilder.build_error_response(
-                f"Invalid data type: {data_type}",
+                "Date or date range required for menstrual data",
                 "invalid_parameters",
-                ["Valid types: 'pregnancy', 'menstrual'"],
+                [
+                    "Provide date for single day",
+                    "Or provide start_date and end_date for calendar view",
+                ],
             )
 
-    except GarminAPIError as e:
-        return ResponseBuilder.build_error_response(e.message, "api_error")
-    except Exception as e:
-        return ResponseBuilder.build_error_response(str(e), "internal_error")
+    else:
+        return ResponseBuilder.build_error_response(
+            f"Invalid data type: {data_type}",
+            "invalid_parameters",
+            ["Valid types: 'pregnancy', 'menstrual'"],
+        )
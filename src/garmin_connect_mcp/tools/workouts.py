@@ -1,93 +1,208 @@
 """Workout management tools for Garmin Connect MCP server."""
 
-from typing import Annotated
+from collections.abc import Awaitable, Callable
+from typing import Annotated, Any, Literal, TypedDict
 
 from fastmcp import Context
 
-from ..client import GarminAPIError
+from ..cache import clear_cache
+from ..client import GarminClientWrapper, run_in_api_thread
+from ..pagination import build_pagination_info, decode_cursor
 from ..response_builder import ResponseBuilder
+from ._common import garmin_tool, get_client
 
+WorkoutAction = Literal["list", "get", "download", "upload", "invalidate"]
 
+
+class WorkoutParams(TypedDict):
+    """Parameters passed from manage_workouts to each action handler."""
+
+    workout_id: int | None
+    workout_data: str | None
+    include_details: bool
+    cursor: str | None
+    limit: int
+
+
+WorkoutHandler = Callable[[GarminClientWrapper, WorkoutParams], Awaitable[str]]
+
+# Workout detail requests allowed in flight at once, to stay clear of rate limits
+DETAIL_FETCH_CONCURRENCY = 8
+
+# Workouts returned per page by the list action
+DEFAULT_WORKOUT_LIMIT = 50
+MAX_WORKOUT_LIMIT = 100
+
+
+async def _list_workouts(client: GarminClientWrapper, params: WorkoutParams) -> str:
+    """Get a page of workouts, optionally with each workout's details fetched concurrently."""
+    # Parse cursor to get current page
+    current_page = 1
+    if params["cursor"]:
+        try:
+            current_page = max(decode_cursor(params["cursor"]).get("page", 1), 1)
+        except ValueError:
+            return ResponseBuilder.build_error_response(
+                "Invalid pagination cursor",
+                error_type="validation_error",
+            )
+
+    # Validate limit, capping oversized pages rather than rejecting them
+    limit = params["limit"]
+    if limit < 1:
+        return ResponseBuilder.build_error_response(
+            f"Invalid limit: {limit}. Must be at least 1.",
+            error_type="validation_error",
+        )
+    limit = min(limit, MAX_WORKOUT_LIMIT)
+
+    # Garmin returns every workout at once (and it is cached), so slice the page in memory
+    all_workouts = await run_in_api_thread(client.safe_call, "get_workouts")
+    offset = (current_page - 1) * limit
+    workouts = all_workouts[offset : offset + limit]
+    has_more = offset + limit < len(all_workouts)
+
+    data: dict[str, Any] = {
+        "workouts": workouts,
+        "count": len(workouts),
+        "total": len(all_workouts),
+    }
+
+    # Only fetch details for the workouts on this page
+    if params["include_details"]:
+        ids = [w["workoutId"] for w in workouts if w.get("workoutId") is not None]
+        data["details"] = await client.gather_optional(
+            [(str(wid), "get_workout", (wid,)) for wid in ids],
+            max_concurrency=DETAIL_FETCH_CONCURRENCY,
+        )
+
+    return ResponseBuilder.build_response(
+        data=data,
+        metadata={"action": "list", "include_details": params["include_details"]},
+        pagination=build_pagination_info(
+            returned_count=len(workouts),
+            limit=limit,
+            current_page=current_page,
+            has_more=has_more,
+        ),
+    )
+
+
+async def _get_workout(client: GarminClientWrapper, params: WorkoutParams) -> str:
+    """Get a specific workout by ID."""
+    workout_id = params["workout_id"]
+    if workout_id is None:
+        return ResponseBuilder.build_error_response(
+            "Workout ID required for get action",
+            "invalid_parameters",
+            ["Provide workout_id parameter"],
+        )
+
+    workout = await run_in_api_thread(client.safe_call, "get_workout", workout_id)
+    return ResponseBuilder.build_response(
+        data={"workout": workout},
+        metadata={"action": "get", "workout_id": workout_id},
+    )
+
+
+async def _download_workout(client: GarminClientWrapper, params: WorkoutParams) -> str:
+    """Download a workout file."""
+    workout_id = params["workout_id"]
+    if workout_id is None:
+        return ResponseBuilder.build_error_response(
+            "Workout ID required for download action",
+            "invalid_parameters",
+            ["Provide workout_id parameter"],
+        )
+
+    download_info = await run_in_api_thread(client.safe_call, "download_workout", workout_id)
+    return ResponseBuilder.build_response(
+        data={"download_info": download_info},
+        metadata={"action": "download", "workout_id": workout_id},
+    )
+
+
+async def _upload_workout(client: GarminClientWrapper, params: WorkoutParams) -> str:
+    """Upload a new workout."""
+    workout_data = params["workout_data"]
+    if not workout_data:
+        return ResponseBuilder.build_error_response(
+            "Workout data required for upload action",
+            "invalid_parameters",
+            ["Provide workout_data parameter"],
+        )
+
+    result = await run_in_api_thread(client.safe_call, "upload_workout", workout_data)
+    return ResponseBuilder.build_response(
+        data={"result": result},
+        analysis={"insights": ["Workout uploaded successfully"]},
+        metadata={"action": "upload"},
+    )
+
+
+async def _invalidate_workouts(client: GarminClientWrapper, params: WorkoutParams) -> str:
+    """Drop cached workouts so the next list/get fetches them from Garmin."""
+    for method_name in ("get_workouts", "get_workout"):
+        clear_cache(f"garmin:{method_name}")
+    return ResponseBuilder.build_response(
+        data={"invalidated": True},
+        metadata={"action": "invalidate"},
+    )
+
+
+# Handlers for each manage_workouts action
+_ACTIONS: dict[WorkoutAction, WorkoutHandler] = {
+    "list": _list_workouts,
+    "get": _get_workout,
+    "download": _download_workout,
+    "upload": _upload_workout,
+    "invalidate": _invalidate_workouts,
+}
+
+
+@garmin_tool()
 async def manage_workouts(
-    action: Annotated[str, "Action: 'list', 'get', 'download', 'upload'"],
+    action: Annotated[WorkoutAction, "Action: 'list', 'get', 'download', 'upload', 'invalidate'"],
     workout_id: Annotated[int | None, "Workout ID (for get/download actions)"] = None,
     workout_data: Annotated[str | None, "Workout data (for upload action)"] = None,
+    include_details: Annotated[
+        bool, "Also fetch each workout's details, keyed by workout ID (for list action)"
+    ] = False,
+    cursor: Annotated[str | None, "Pagination cursor from previous response (for list)"] = None,
+    limit: Annotated[
+        int, f"Maximum workouts per page (capped at {MAX_WORKOUT_LIMIT}, for list action)"
+    ] = DEFAULT_WORKOUT_LIMIT,
     ctx: Context | None = None,
 ) -> str:
     """
     Manage structured workouts.
 
     Actions:
-    - list: Get all workouts
+    - list: Get a page of workouts (with details for each if include_details is set).
+      "count" is the page size and "total" the number of saved workouts; use
+      response["pagination"]["cursor"] to fetch the next page.
     - get: Get specific workout by ID
     - download: Download workout file
     - upload: Upload a new workout
+    - invalidate: Discard cached workouts so the next list/get is fetched fresh
     """
-    assert ctx is not None
-    try:
-        client = await ctx.get_state("client")
-
-        if action == "list":
-            workouts = client.safe_call("get_workouts")
-            return ResponseBuilder.build_response(
-                data={
-                    "workouts": workouts,
-                    "count": len(workouts) if isinstance(workouts, list) else 0,
-                },
-                metadata={"action": "list"},
-            )
-
-        elif action == "get":
-            if workout_id is None:
-                return ResponseBuilder.build_error_response(
-                    "Workout ID required for get action",
-                    "invalid_parameters",
-                    ["Provide workout_id parameter"],
-                )
-
-            workout = client.safe_call("get_workout", workout_id)
-            return ResponseBuilder.build_response(
-                data={"workout": workout},
-                metadata={"action": "get", "workout_id": workout_id},
-            )
-
-        elif action == "download":
-            if workout_id is None:
-                return ResponseBuilder.build_error_response(
-                    "Workout ID required for download action",
-                    "invalid_parameters",
-                    ["Provide workout_id parameter"],
-                )
-
-            download_info = client.safe_call("download_workout", workout_id)
-            return ResponseBuilder.build_response(
-                data={"download_info": download_info},
-                metadata={"action": "download", "workout_id": workout_id},
-            )
-
-        elif action == "upload":
-            if not workout_data:
-                return ResponseBuilder.build_error_response(
-                    "Workout data required for upload action",
-                    "invalid_parameters",
-                    ["Provide workout_data parameter"],
-                )
-
-            result = client.safe_call("upload_workout", workout_data)
-            return ResponseBuilder.build_response(
-                data={"result": result},
-                analysis={"insights": ["Workout uploaded successfully"]},
-                metadata={"action": "upload"},
-            )
-
-        else:
-            return ResponseBuilder.build_error_response(
-                f"Invalid action: {action}",
-                "invalid_parameters",
-                ["Valid actions: 'list', 'get', 'download', 'upload'"],
-            )
+    # FastMCP rejects unknown actions against the Literal; this guards direct callers
+    handler = _ACTIONS.get(action)
+    if handler is None:
+        return ResponseBuilder.build_error_response(
+            f"Invalid action: {action}",
+            "invalid_parameters",
+            ["Valid actions: 'list', 'get', 'download', 'upload', 'invalidate'"],
+        )
 
-    except GarminAPIError as e:
-        return ResponseBuilder.build_error_response(e.message, "api_error")
-    except Exception as e:
-        return ResponseBuilder.build_error_response(str(e), "internal_error")
+    client = await get_client(ctx)
+    return await handler(
+        client,
+        {
+            "workout_id": workout_id,
+            "workout_data": workout_data,
+            "include_details": include_details,
+            "cursor": cursor,
+            "limit": limit,
+        },
+    )
@@ -1,7 +1,12 @@
 """Pytest configuration and shared fixtures."""
 
+from collections.abc import Callable, Iterator
+from typing import Any
+
 import pytest
 
+from garmin_connect_mcp.cache import clear_cache
+from garmin_connect_mcp.client import GarminClientWrapper
 from garmin_connect_mcp.types import HeartRateData, SleepData, StepsData, StressData
 
 
@@ -83,3 +88,58 @@ def sample_steps_data() -> StepsData:
             {"steps": 1800, "startGMT": "2024-01-15T10:00:00", "endGMT": "2024-01-15T11:00:00"},
         ],
     }
+
+
+class RecordingGarmin:
+    """
+    Stand-in for the Garmin client that serves canned responses and records calls.
+
+    A response that is an exception is raised, and a callable response is called with
+    the method's arguments.
+    """
+
+    def __init__(self, responses: dict[str, Any], display_name: str = "runner"):
+        self.display_name = display_name
+        self.responses = responses
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    @property
+    def method_names(self) -> list[str]:
+        """Names of the methods called, in order."""
+        return [name for name, _ in self.calls]
+
+    def __getattr__(self, name: str):
+        if name not in self.responses:
+            raise AttributeError(name)
+
+        def method(*args, **kwargs):
+            self.calls.append((name, args))
+            response = self.responses[name]
+            if isinstance(response, Exception):
+                raise response
+            return response(*args, **kwargs) if callable(response) else response
+
+        return method
+
+
+class FakeContext:
+    """Minimal tool context holding the client that ConfigMiddleware would inject."""
+
+    def __init__(self, client: GarminClientWrapper):
+        self._state: dict[str, Any] = {"client": client}
+
+    async def get_state(self, key: str) -> Any:
+        return self._state.get(key)
+
+
+@pytest.fixture
+def tool_context() -> Iterator[Callable[[dict[str, Any]], tuple[Any, RecordingGarmin]]]:
+    """Build a tool context around a fake Garmin client, with an empty response cache."""
+
+    def make(responses: dict[str, Any]) -> tuple[Any, RecordingGarmin]:
+        garmin = RecordingGarmin(responses)
+        return FakeContext(GarminClientWrapper(garmin)), garmin
+
+    clear_cache()
+    yield make
+    clear_cache()
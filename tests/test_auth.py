@@ -0,0 +1,17 @@
+"""Tests for authentication and configuration helpers."""
+
+from pathlib import Path
+
+from garmin_connect_mcp.auth import get_capabilities_path, get_token_store
+
+
+def test_capabilities_file_is_kept_out_of_token_store(monkeypatch, tmp_path):
+    """Test that the capabilities file can't be mistaken for saved tokens."""
+    monkeypatch.setenv("GARMINTOKENS", str(tmp_path / "tokens"))
+
+    token_store = Path(get_token_store())
+    capabilities_path = get_capabilities_path()
+
+    assert capabilities_path.parent == tmp_path
+    assert capabilities_path.name == "tokens_capabilities.json"
+    assert list(token_store.iterdir()) == []
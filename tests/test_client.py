@@ -0,0 +1,550 @@
+"""Tests for the Garmin client wrapper."""
+
+import asyncio
+import contextvars
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from garminconnect import GarminConnectConnectionError
+
+from garmin_connect_mcp import client as client_module
+from garmin_connect_mcp.auth import GarminConfig
+from garmin_connect_mcp.cache import (
+    clear_cache,
+    get_cache_stats,
+    get_stale_age,
+    track_stale_hits,
+)
+from garmin_connect_mcp.client import (
+    GarminAuthenticationError,
+    GarminClientWrapper,
+    GarminNotFoundError,
+    get_shared_wrapper,
+    get_shared_wrapper_async,
+    peek_shared_wrapper,
+    reset_shared_wrapper,
+)
+from garmin_connect_mcp.config import get_tool_config
+from tests.conftest import RecordingGarmin
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start each test with an empty response cache."""
+    clear_cache()
+    yield
+    clear_cache()
+
+
+class SlowGarmin(RecordingGarmin):
+    """Fake client whose heart rate endpoint stalls."""
+
+    def get_heart_rates(self, date: str):
+        time.sleep(0.2)
+        return {"restingHeartRate": 50}
+
+
+def not_found() -> GarminConnectConnectionError:
+    return GarminConnectConnectionError("404 Client Error: Not Found")
+
+
+def test_optional_call_skips_endpoint_after_not_found():
+    """Test that a 404 from a capability endpoint stops further requests."""
+    garmin = RecordingGarmin({"get_spo2_data": not_found()})
+    client = GarminClientWrapper(garmin)
+
+    assert client.optional_call("get_spo2_data", "2024-01-15") is None
+    assert client.optional_call("get_spo2_data", "2024-01-16") is None
+
+    assert garmin.method_names == ["get_spo2_data"]
+    assert client.is_unsupported("get_spo2_data")
+
+
+def test_optional_call_keeps_endpoint_that_returned_data():
+    """Test that an endpoint which has returned data is not marked unsupported."""
+    garmin = RecordingGarmin({"get_spo2_data": {"averageSpO2": 96}})
+    client = GarminClientWrapper(garmin)
+
+    assert client.optional_call("get_spo2_data", "2024-01-15") == {"averageSpO2": 96}
+    garmin.responses["get_spo2_data"] = not_found()
+    assert client.optional_call("get_spo2_data", "2024-01-16") is None
+
+    assert not client.is_unsupported("get_spo2_data")
+
+
+def test_optional_call_does_not_mark_core_endpoints():
+    """Test that a 404 from a non-capability endpoint is retried on later calls."""
+    garmin = RecordingGarmin({"get_stats": not_found()})
+    client = GarminClientWrapper(garmin)
+
+    client.optional_call("get_stats", "2024-01-15")
+    client.optional_call("get_stats", "2024-01-16")
+
+    assert garmin.method_names == ["get_stats", "get_stats"]
+
+
+def test_unsupported_endpoints_persist_per_user(tmp_path):
+    """Test that unsupported endpoints are remembered across wrappers for the same user."""
+    capabilities_path = tmp_path / "capabilities.json"
+    first = GarminClientWrapper(
+        RecordingGarmin({"get_hydration_data": not_found()}), capabilities_path=capabilities_path
+    )
+    first.optional_call("get_hydration_data", "2024-01-15")
+
+    same_user = RecordingGarmin({"get_hydration_data": {"valueInML": 500}})
+    other_user = RecordingGarmin({"get_hydration_data": {"valueInML": 500}}, display_name="cyclist")
+
+    assert GarminClientWrapper(same_user, capabilities_path).is_unsupported("get_hydration_data")
+    assert not GarminClientWrapper(other_user, capabilities_path).is_unsupported(
+        "get_hydration_data"
+    )
+
+
+def test_unsupported_endpoints_expire(tmp_path, monkeypatch):
+    """Test that an unsupported endpoint is retried once its entry is older than the TTL."""
+    capabilities_path = tmp_path / "capabilities.json"
+    garmin = RecordingGarmin({"get_hydration_data": not_found()})
+    client = GarminClientWrapper(garmin, capabilities_path=capabilities_path)
+    client.optional_call("get_hydration_data", "2024-01-15")
+    assert client.is_unsupported("get_hydration_data")
+
+    ttl = get_tool_config().unsupported_endpoint_ttl_seconds
+    later = time.time() + ttl + 1
+    monkeypatch.setattr(client_module.time, "time", lambda: later)
+    garmin.responses["get_hydration_data"] = {"valueInML": 500}
+
+    assert not GarminClientWrapper(garmin, capabilities_path).is_unsupported("get_hydration_data")
+    assert client.optional_call("get_hydration_data", "2024-01-16") == {"valueInML": 500}
+    assert garmin.method_names == ["get_hydration_data", "get_hydration_data"]
+
+
+def test_login_restores_token_directory_from_exported_tokens(monkeypatch, tmp_path):
+    """Test that exported token JSON is loaded directly and written back to the token store."""
+    token_dir = tmp_path / "tokens"
+    token_dir.mkdir()
+    exported = tmp_path / "tokens_base64"
+    exported.write_text('{"di_token": "abc", "di_refresh_token": "def"}\n')
+    events: list[tuple[str, str]] = []
+
+    class TokenClient:
+        def loads(self, tokens: str):
+            events.append(("loads", tokens))
+
+        def dump(self, path: str):
+            events.append(("dump", path))
+            (Path(path) / "garmin_tokens.json").write_text("{}")
+
+    class TokenGarmin:
+        def __init__(self, email=None, password=None, prompt_mfa=None):
+            assert email is None, "credential login should not be attempted"
+            self.client = TokenClient()
+
+        def login(self, tokenstore=None):
+            events.append(("login", tokenstore))
+
+    monkeypatch.setattr(client_module, "Garmin", TokenGarmin)
+    monkeypatch.setattr(client_module, "get_token_store", lambda: str(token_dir))
+    monkeypatch.setattr(client_module, "get_token_base64_path", lambda: str(exported))
+
+    garmin = client_module.init_garmin_client(GarminConfig())
+
+    assert isinstance(garmin, TokenGarmin)
+    assert events == [
+        ("loads", '{"di_token": "abc", "di_refresh_token": "def"}'),
+        ("dump", str(token_dir)),
+        ("login", str(token_dir)),
+    ]
+    assert (token_dir / "garmin_tokens.json").exists()
+
+
+def test_safe_call_caches_read_only_endpoints():
+    """Test that identical calls to a cacheable endpoint hit the API once."""
+    garmin = RecordingGarmin({"get_max_metrics": {"vo2Max": 52}})
+    client = GarminClientWrapper(garmin)
+
+    assert client.safe_call("get_max_metrics", "2024-01-15") == {"vo2Max": 52}
+    assert client.safe_call("get_max_metrics", "2024-01-15") == {"vo2Max": 52}
+    client.safe_call("get_max_metrics", "2024-01-16")
+
+    assert garmin.method_names == ["get_max_metrics", "get_max_metrics"]
+
+
+def test_safe_call_does_not_cache_other_endpoints():
+    """Test that endpoints outside the read-only whitelist always hit the API."""
+    garmin = RecordingGarmin({"get_heart_rates": {}})
+    client = GarminClientWrapper(garmin)
+
+    client.safe_call("get_heart_rates", "2024-01-15")
+    client.safe_call("get_heart_rates", "2024-01-15")
+
+    assert garmin.method_names == ["get_heart_rates", "get_heart_rates"]
+
+
+def test_full_name_outlives_default_cache_ttl(monkeypatch):
+    """Test that the account name stays cached after short-lived entries expire."""
+    monkeypatch.setattr(get_tool_config(), "api_cache_ttl_seconds", 0)
+    garmin = RecordingGarmin({"get_full_name": "Alex Runner", "get_max_metrics": {"vo2Max": 52}})
+    client = GarminClientWrapper(garmin)
+
+    for _ in range(2):
+        client.safe_call("get_full_name")
+        client.safe_call("get_max_metrics", "2024-01-15")
+
+    assert garmin.method_names == ["get_full_name", "get_max_metrics", "get_max_metrics"]
+
+
+@pytest.fixture
+def logins(monkeypatch, tmp_path):
+    """Record Garmin logins made while building the shared client."""
+    made: list[RecordingGarmin | None] = []
+    outcomes: list[RecordingGarmin | None] = []
+
+    def fake_init(config):
+        garmin = outcomes.pop(0) if outcomes else RecordingGarmin({})
+        made.append(garmin)
+        return garmin
+
+    monkeypatch.setattr(client_module, "init_garmin_client", fake_init)
+    monkeypatch.setattr(
+        client_module, "get_capabilities_path", lambda: tmp_path / "capabilities.json"
+    )
+    reset_shared_wrapper()
+    yield made, outcomes
+    reset_shared_wrapper()
+
+
+def test_shared_wrapper_logs_in_once_across_threads(logins):
+    """Test that concurrent first calls share a single login."""
+    made, _ = logins
+    config = GarminConfig()
+    wrappers = []
+
+    threads = [
+        threading.Thread(target=lambda: wrappers.append(get_shared_wrapper(config)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(made) == 1
+    assert all(wrapper is wrappers[0] for wrapper in wrappers)
+
+
+def test_shared_wrapper_retries_after_failed_login(logins):
+    """Test that a failed login is not cached."""
+    made, outcomes = logins
+    outcomes.append(None)
+    config = GarminConfig()
+
+    assert get_shared_wrapper(config) is None
+    assert get_shared_wrapper(config) is not None
+    assert len(made) == 2
+
+
+async def test_gather_optional_reports_slow_calls_as_missing(monkeypatch):
+    """Test that a call exceeding the timeout doesn't hold up the other results."""
+    monkeypatch.setattr(get_tool_config(), "optional_call_timeout_seconds", 0.05)
+    client = GarminClientWrapper(SlowGarmin({"get_stats": {"totalSteps": 9000}}))
+
+    results = await client.gather_optional(
+        [
+            ("stats", "get_stats", ("2024-01-15",)),
+            ("heart_rate", "get_heart_rates", ("2024-01-15",)),
+        ]
+    )
+
+    assert results == {"stats": {"totalSteps": 9000}, "heart_rate": None}
+
+
+def test_write_endpoint_invalidates_cached_reads():
+    """Test that adding a weigh-in drops cached weigh-in responses."""
+    garmin = RecordingGarmin({"get_daily_weigh_ins": {"totalAverage": {}}, "add_weigh_in": {}})
+    client = GarminClientWrapper(garmin)
+
+    client.safe_call("get_daily_weigh_ins", "2024-01-15")
+    client.safe_call("add_weigh_in", 72.5, "2024-01-15")
+    client.safe_call("get_daily_weigh_ins", "2024-01-15")
+
+    assert garmin.method_names == ["get_daily_weigh_ins", "add_weigh_in", "get_daily_weigh_ins"]
+
+
+async def test_async_shared_wrapper_logs_in_once_for_concurrent_callers(logins):
+    """Test that concurrent coroutines awaiting the client share a single login."""
+    made, _ = logins
+    config = GarminConfig()
+
+    wrappers = await asyncio.gather(*(get_shared_wrapper_async(config) for _ in range(8)))
+
+    assert len(made) == 1
+    assert all(wrapper is wrappers[0] for wrapper in wrappers)
+
+
+async def test_gather_optional_limits_calls_in_flight():
+    """Test that max_concurrency caps how many calls run at once."""
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    class CountingGarmin(RecordingGarmin):
+        def get_menstrual_data_for_date(self, date: str):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return {"date": date}
+
+    client = GarminClientWrapper(CountingGarmin({}))
+    specs = [(str(day), "get_menstrual_data_for_date", (str(day),)) for day in range(10)]
+
+    results = await client.gather_optional(specs, max_concurrency=2)
+
+    assert peak <= 2
+    assert results["7"] == {"date": "7"}
+
+
+def test_expired_response_served_during_outage(monkeypatch):
+    """Test that a cached response stands in for a failed refresh and is flagged stale."""
+    monkeypatch.setattr(get_tool_config(), "api_cache_ttl_seconds", 0)
+    garmin = RecordingGarmin({"get_max_metrics": {"vo2Max": 52}})
+    client = GarminClientWrapper(garmin)
+
+    def refresh_during_outage():
+        track_stale_hits()
+        client.safe_call("get_max_metrics", "2024-01-15")
+        outage = GarminConnectConnectionError("503 Service Unavailable")
+        garmin.responses["get_max_metrics"] = outage
+        return client.safe_call("get_max_metrics", "2024-01-15"), get_stale_age()
+
+    result, stale_age = contextvars.copy_context().run(refresh_during_outage)
+
+    assert result == {"vo2Max": 52}
+    assert stale_age is not None
+
+
+def test_expired_response_not_served_for_not_found(monkeypatch):
+    """Test that a 404 is reported rather than masked by an expired cached response."""
+    monkeypatch.setattr(get_tool_config(), "api_cache_ttl_seconds", 0)
+    garmin = RecordingGarmin({"get_max_metrics": {"vo2Max": 52}})
+    client = GarminClientWrapper(garmin)
+
+    client.safe_call("get_max_metrics", "2024-01-15")
+    garmin.responses["get_max_metrics"] = not_found()
+
+    with pytest.raises(GarminNotFoundError):
+        client.safe_call("get_max_metrics", "2024-01-15")
+
+
+def test_concurrent_cache_misses_share_one_request():
+    """Test that simultaneous calls for the same uncached key hit the API once."""
+
+    class SlowDevicesGarmin(RecordingGarmin):
+        def get_devices(self):
+            self.calls.append(("get_devices", ()))
+            time.sleep(0.05)
+            return [{"deviceId": 1}]
+
+    garmin = SlowDevicesGarmin({})
+    client = GarminClientWrapper(garmin)
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(client.safe_call("get_devices")))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert garmin.method_names == ["get_devices"]
+    assert results == [[{"deviceId": 1}]] * 5
+
+
+def test_cache_evicts_least_recently_used_entry(monkeypatch):
+    """Test that the cache stays within its size limit, keeping recently used entries."""
+    monkeypatch.setattr(get_tool_config(), "cache_max_entries", 2)
+    garmin = RecordingGarmin({"get_max_metrics": {"vo2Max": 52}})
+    client = GarminClientWrapper(garmin)
+
+    client.safe_call("get_max_metrics", "2024-01-15")
+    client.safe_call("get_max_metrics", "2024-01-16")
+    client.safe_call("get_max_metrics", "2024-01-15")
+    client.safe_call("get_max_metrics", "2024-01-17")
+    garmin.calls.clear()
+
+    client.safe_call("get_max_metrics", "2024-01-15")
+    client.safe_call("get_max_metrics", "2024-01-16")
+
+    assert garmin.method_names == ["get_max_metrics"]
+    assert get_cache_stats()["total_entries"] == 2
+
+
+async def test_login_prefetches_common_requests(logins):
+    """Test that logging in warms the cache for the profile endpoints."""
+    _, outcomes = logins
+    garmin = RecordingGarmin({"get_full_name": "Alex Runner", "get_devices": [], "get_stats": {}})
+    outcomes.append(garmin)
+
+    wrapper = await get_shared_wrapper_async(GarminConfig())
+    assert wrapper is not None
+    assert client_module._prefetch_task is not None
+    await client_module._prefetch_task
+    wrapper.safe_call("get_full_name")
+
+    assert sorted(garmin.method_names) == ["get_devices", "get_full_name", "get_stats"]
+
+
+async def test_gather_optional_runs_on_api_threads():
+    """Test that optional calls run on the dedicated Garmin executor."""
+
+    class ThreadNameGarmin(RecordingGarmin):
+        def get_heart_rates(self, date: str):
+            return {"thread": threading.current_thread().name}
+
+    client = GarminClientWrapper(ThreadNameGarmin({}))
+
+    results = await client.gather_optional([("heart_rate", "get_heart_rates", ("2024-01-15",))])
+
+    assert results["heart_rate"]["thread"].startswith("garmin")
+
+
+def test_peek_shared_wrapper_only_returns_logged_in_client(logins):
+    """Test that peeking never triggers a login."""
+    made, _ = logins
+
+    assert peek_shared_wrapper() is None
+    wrapper = get_shared_wrapper(GarminConfig())
+
+    assert peek_shared_wrapper() is wrapper
+    assert len(made) == 1
+
+
+def test_expired_login_resets_shared_wrapper(logins):
+    """Test that a 401 from a required call drops the shared client."""
+    _, outcomes = logins
+    outcomes.append(
+        RecordingGarmin({"get_stats": GarminConnectConnectionError("401 Unauthorized")})
+    )
+    wrapper = get_shared_wrapper(GarminConfig())
+    assert wrapper is not None
+
+    with pytest.raises(GarminAuthenticationError):
+        wrapper.safe_call("get_stats", "2024-01-15")
+
+    assert peek_shared_wrapper() is None
+
+
+def test_forbidden_feature_keeps_shared_wrapper(logins):
+    """Test that 403s and optional auth failures don't force a re-login."""
+    made, outcomes = logins
+    outcomes.append(
+        RecordingGarmin(
+            {
+                "get_training_readiness": GarminConnectConnectionError("403 Forbidden"),
+                "get_hrv_data": GarminConnectConnectionError("401 Unauthorized"),
+            }
+        )
+    )
+    wrapper = get_shared_wrapper(GarminConfig())
+    assert wrapper is not None
+
+    with pytest.raises(GarminAuthenticationError):
+        wrapper.safe_call("get_training_readiness", "2024-01-15")
+    assert wrapper.optional_call("get_hrv_data", "2024-01-15") is None
+
+    assert peek_shared_wrapper() is wrapper
+    assert len(made) == 1
+
+
+def test_reset_forgets_only_this_users_unsupported_endpoints(logins, tmp_path):
+    """Test that dropping the shared client clears its user's capabilities, not others'."""
+    _, outcomes = logins
+    capabilities_path = tmp_path / "capabilities.json"
+    other = GarminClientWrapper(
+        RecordingGarmin({"get_spo2_data": not_found()}, display_name="cyclist"), capabilities_path
+    )
+    other.optional_call("get_spo2_data", "2024-01-15")
+
+    outcomes.append(RecordingGarmin({"get_spo2_data": not_found()}))
+    wrapper = get_shared_wrapper(GarminConfig())
+    assert wrapper is not None
+    wrapper.optional_call("get_spo2_data", "2024-01-15")
+    assert set(json.loads(capabilities_path.read_text())) == {"runner", "cyclist"}
+
+    reset_shared_wrapper()
+
+    assert not wrapper.is_unsupported("get_spo2_data")
+    assert set(json.loads(capabilities_path.read_text())) == {"cyclist"}
+
+
+def test_expired_login_on_other_client_keeps_shared_wrapper(logins):
+    """Test that a 401 from a client other than the shared one doesn't drop it."""
+    shared = get_shared_wrapper(GarminConfig())
+    other = GarminClientWrapper(
+        RecordingGarmin({"get_stats": GarminConnectConnectionError("401 Unauthorized")})
+    )
+
+    with pytest.raises(GarminAuthenticationError):
+        other.safe_call("get_stats", "2024-01-15")
+
+    assert peek_shared_wrapper() is shared
+
+
+def test_workout_upload_invalidates_cached_list():
+    """Test that uploading a workout drops the cached workout list but not single workouts."""
+    garmin = RecordingGarmin({"get_workouts": [], "get_workout": {}, "upload_workout": {}})
+    client = GarminClientWrapper(garmin)
+
+    client.safe_call("get_workouts")
+    client.safe_call("get_workout", 1)
+    client.safe_call("upload_workout", "{}")
+    client.safe_call("get_workouts")
+    client.safe_call("get_workout", 1)
+
+    assert garmin.method_names == ["get_workouts", "get_workout", "upload_workout", "get_workouts"]
+
+
+def test_requests_in_flight_are_capped_across_callers(monkeypatch):
+    """Test that concurrent safe_call users share the outbound request limit."""
+    monkeypatch.setattr(get_tool_config(), "api_max_concurrent_requests", 2)
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    class CountingGarmin(RecordingGarmin):
+        def get_heart_rates(self, date: str):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return {}
+
+    client = GarminClientWrapper(CountingGarmin({}))
+    threads = [
+        threading.Thread(target=client.safe_call, args=("get_heart_rates", str(day)))
+        for day in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+
+
+def test_list_endpoints_normalize_missing_results():
+    """Test that list endpoints return an empty list when Garmin returns nothing."""
+    client = GarminClientWrapper(RecordingGarmin({"get_workouts": None}))
+
+    assert client.safe_call("get_workouts") == []
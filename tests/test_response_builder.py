@@ -1,8 +1,11 @@
 """Tests for ResponseBuilder."""
 
 import json
-from datetime import datetime
+from datetime import UTC, date, datetime, timedelta, timezone
 
+import pytest
+
+from garmin_connect_mcp import response_builder
 from garmin_connect_mcp.response_builder import ResponseBuilder
 
 
@@ -58,6 +61,33 @@ def test_format_date_with_day_monday():
     assert "Monday" in result["formatted"]
 
 
+def test_format_date_with_day_keeps_each_offset():
+    """Test that equal instants in different timezones keep their own local date."""
+    utc = datetime(2025, 10, 15, 23, 30, tzinfo=UTC)
+    plus_two = utc.astimezone(timezone(timedelta(hours=2)))
+
+    first = ResponseBuilder.format_date_with_day(utc)
+    second = ResponseBuilder.format_date_with_day(plus_two)
+
+    assert first is not None and second is not None
+    assert first["date"] == "2025-10-15"
+    assert second["date"] == "2025-10-16"
+    assert second["day_of_week"] == "Thursday"
+    assert second["datetime"] == "2025-10-16T01:30:00+02:00"
+
+
+def test_format_date_with_day_caches_repeated_datetimes():
+    """Test that formatting the same datetime again is served from the date cache."""
+    week_start = datetime(2031, 3, 3)
+    ResponseBuilder.format_date_with_day(week_start)
+    hits = response_builder._date_fields.cache_info().hits
+
+    result = ResponseBuilder.format_date_with_day(datetime(2031, 3, 3))
+
+    assert response_builder._date_fields.cache_info().hits == hits + 1
+    assert result is not None and result["day_of_week"] == "Monday"
+
+
 def test_build_response_with_datetime_conversion():
     """Test that build_response converts datetime objects to ISO strings."""
     data = {
@@ -74,6 +104,28 @@ def test_build_response_with_datetime_conversion():
     assert "fetched_at" in parsed["metadata"]
 
 
+def test_build_response_keeps_non_ascii_text():
+    """Test that non-ASCII names are emitted as-is rather than \\u-escaped."""
+    result = ResponseBuilder.build_response({"name": "Zürich Lauf"})
+
+    assert "Zürich Lauf" in result
+    assert json.loads(result)["data"]["name"] == "Zürich Lauf"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_build_response_encodes_non_string_keys(monkeypatch, use_orjson):
+    """Test that date, number and tuple keys encode the same with or without orjson."""
+    if use_orjson and response_builder.orjson is None:
+        pytest.skip("orjson is not installed")
+    if not use_orjson:
+        monkeypatch.setattr(response_builder, "orjson", None)
+
+    data = {date(2025, 10, 15): {"steps": 9000}, 3: "three", ("a", 1): "pair"}
+    parsed = json.loads(ResponseBuilder.build_response(data))
+
+    assert parsed["data"] == {"2025-10-15": {"steps": 9000}, "3": "three", "('a', 1)": "pair"}
+
+
 def test_format_activity_with_date_fields():
     """Test that format_activity uses format_date_with_day for date fields."""
     activity = {
@@ -126,3 +178,21 @@ def test_format_activity_with_missing_dates():
 
     # Should not have date fields if they weren't in the original
     assert "startTimeLocal" not in result or result.get("startTimeLocal") is None
+
+
+def test_format_activities_matches_format_activity():
+    """Test that bulk formatting matches formatting each activity individually."""
+    activities = [
+        {
+            "activityId": i,
+            "distance": 5000 + i,
+            "duration": 1800,
+            "startTimeLocal": f"2025-10-{i % 3 + 13}T07:00:00",
+            "startTimeGMT": f"2025-10-{i % 3 + 13}T06:00:00",
+        }
+        for i in range(100)
+    ]
+
+    result = ResponseBuilder.format_activities(activities, "imperial")
+
+    assert result == [ResponseBuilder.format_activity(a, "imperial") for a in activities]
@@ -2,6 +2,7 @@
 
 import json
 
+from garmin_connect_mcp.config import get_tool_config
 from garmin_connect_mcp.pagination import build_pagination_info
 from garmin_connect_mcp.response_builder import ResponseBuilder
 
@@ -55,6 +56,15 @@ def test_error_response_is_compact():
     assert len(parsed["error"]["suggestions"]) == 2
 
 
+def test_error_response_omits_empty_suggestions():
+    """Test that error responses leave out suggestions when there are none."""
+    for suggestions in (None, []):
+        response = ResponseBuilder.build_error_response("Test error", "test_error", suggestions)
+        parsed = json.loads(response)
+
+        assert "suggestions" not in parsed["error"]
+
+
 def test_response_size_with_default_limits():
     """Test that responses with default limits are reasonable size."""
     # Simulate 10 activities (default limit)
@@ -88,3 +98,15 @@ def test_response_size_with_default_limits():
 
     # For 10 activities, should be much smaller
     assert size < 10_000, f"Response size {size} is larger than expected for 10 activities"
+
+
+def test_error_response_includes_cause_only_in_debug_mode(monkeypatch):
+    """Test that the underlying exception is only described when debug info is enabled."""
+    cause = ConnectionError("connection reset")
+
+    parsed = json.loads(ResponseBuilder.build_error_response("Failed", cause=cause))
+    assert "detail" not in parsed["error"]
+
+    monkeypatch.setattr(get_tool_config(), "include_debug_info", True)
+    parsed = json.loads(ResponseBuilder.build_error_response("Failed", cause=cause))
+    assert parsed["error"]["detail"] == "ConnectionError: connection reset"
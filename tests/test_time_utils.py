@@ -0,0 +1,69 @@
+"""Tests for time and date utilities."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from garmin_connect_mcp.time_utils import (
+    MAX_RANGE_DAYS,
+    date_range_strings,
+    resolve_date,
+    validate_date_range,
+)
+
+
+def test_validate_date_range_returns_inclusive_day_count():
+    """Test that both ends of the range are counted."""
+    assert validate_date_range(datetime(2024, 1, 1), datetime(2024, 1, 7)) == 7
+    assert validate_date_range(datetime(2024, 1, 1), datetime(2024, 1, 1)) == 1
+
+
+def test_validate_date_range_rejects_inverted_range():
+    """Test that a start date after the end date is rejected."""
+    with pytest.raises(ValueError, match="before or equal"):
+        validate_date_range(datetime(2024, 1, 7), datetime(2024, 1, 1))
+
+
+def test_validate_date_range_rejects_range_over_maximum():
+    """Test that ranges longer than the maximum span are rejected."""
+    start = datetime(2020, 1, 1)
+
+    assert validate_date_range(start, datetime(2021, 1, 1)) == MAX_RANGE_DAYS + 1
+    with pytest.raises(ValueError, match="Maximum is 366 days"):
+        validate_date_range(start, datetime(2021, 1, 2))
+
+
+def test_resolve_date_formats_explicit_date():
+    """Test that an explicit date is normalized to YYYY-MM-DD."""
+    assert resolve_date("2024-01-15") == "2024-01-15"
+    assert resolve_date(" 2024-01-15 ") == "2024-01-15"
+
+
+def test_resolve_date_defaults_to_today():
+    """Test that a missing date resolves to the default."""
+    today = datetime.now().strftime("%Y-%m-%d")
+    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+    assert resolve_date(None) == today
+    assert resolve_date("") == today
+    assert resolve_date(None, default="yesterday") == yesterday
+
+
+def test_resolve_date_rejects_invalid_date():
+    """Test that invalid dates raise rather than being cached."""
+    with pytest.raises(ValueError, match="Invalid date format"):
+        resolve_date("not-a-date")
+
+
+def test_date_range_strings_crosses_month_and_year_boundaries():
+    """Test that consecutive dates are generated across calendar boundaries."""
+    start = datetime(2023, 12, 30)
+
+    assert date_range_strings(start, 4) == [
+        "2023-12-30",
+        "2023-12-31",
+        "2024-01-01",
+        "2024-01-02",
+    ]
+    assert date_range_strings(start, 2, offset=3) == ["2024-01-02", "2024-01-03"]
+    assert date_range_strings(start, 0) == []
@@ -0,0 +1,22 @@
+"""Tests for the training analysis tools."""
+
+import json
+
+from garmin_connect_mcp.tools.training import analyze_training_period
+
+
+async def test_weekly_breakdown_skips_unparseable_start_times(tool_context):
+    """Test that an odd startTimeLocal is left out of the weeks instead of failing."""
+    activities = [
+        {"distance": 5000, "duration": 1800, "startTimeLocal": "2024-01-02 07:00:00"},
+        {"distance": 8000, "duration": 2400, "startTimeLocal": "not a date"},
+        {"distance": 3000, "duration": 900, "startTimeLocal": None},
+        {"distance": 10000, "duration": 3600, "startTimeLocal": "2024-01-09 07:00:00"},
+    ]
+    ctx, _ = tool_context({"get_activities_by_date": activities})
+
+    parsed = json.loads(await analyze_training_period(period="2024-01-01:2024-01-14", ctx=ctx))
+
+    assert parsed["data"]["summary"]["total_activities"] == 4
+    weekly = parsed["data"]["trends"]["weekly"]
+    assert [week["activities"] for week in weekly] == [1, 1]
@@ -0,0 +1,28 @@
+"""Tests for the weight tools."""
+
+import json
+
+import pytest
+
+from garmin_connect_mcp.tools.weight import manage_weight_data
+
+
+@pytest.mark.parametrize("weigh_in_ids", ["abc", "123,", "1;2", "12, x", "-5", "1.5"])
+async def test_delete_rejects_malformed_ids_before_calling_garmin(tool_context, weigh_in_ids):
+    """Test that malformed weigh-in IDs return an error without any Garmin request."""
+    ctx, garmin = tool_context({"delete_weigh_ins": {}})
+
+    parsed = json.loads(await manage_weight_data("delete", weigh_in_ids=weigh_in_ids, ctx=ctx))
+
+    assert parsed["error"]["type"] == "invalid_parameters"
+    assert garmin.calls == []
+
+
+async def test_delete_parses_comma_separated_ids(tool_context):
+    """Test that valid IDs, with optional spaces, are sent to Garmin as integers."""
+    ctx, garmin = tool_context({"delete_weigh_ins": {}})
+
+    parsed = json.loads(await manage_weight_data("delete", weigh_in_ids=" 123, 456 ", ctx=ctx))
+
+    assert parsed["data"]["deleted_ids"] == [123, 456]
+    assert garmin.calls == [("delete_weigh_ins", ([123, 456],))]
@@ -0,0 +1,46 @@
+"""Tests for the query_womens_health tool."""
+
+import json
+
+from garmin_connect_mcp.tools.womens_health import query_womens_health
+
+
+async def test_daily_granularity_returns_each_day_in_range(tool_context):
+    """Test that a daily menstrual query returns one entry per date, in order."""
+    ctx, garmin = tool_context({"get_menstrual_data_for_date": lambda day: {"day": day}})
+
+    parsed = json.loads(
+        await query_womens_health(
+            "menstrual",
+            start_date="2024-01-30",
+            end_date="2024-02-02",
+            granularity="daily",
+            ctx=ctx,
+        )
+    )
+
+    days = parsed["data"]["menstrual_days"]
+    expected = ["2024-01-30", "2024-01-31", "2024-02-01", "2024-02-02"]
+    assert [entry["date"] for entry in days] == expected
+    assert [entry["menstrual_data"] for entry in days] == [{"day": d} for d in expected]
+    assert parsed["metadata"]["query_type"] == "daily"
+    assert len(garmin.calls) == 4
+
+
+async def test_invalid_granularity_returns_error_response(tool_context):
+    """Test that an unknown granularity is reported rather than raised or ignored."""
+    ctx, garmin = tool_context({"get_menstrual_calendar_data": {}})
+
+    parsed = json.loads(
+        await query_womens_health(
+            "menstrual",
+            start_date="2024-01-01",
+            end_date="2024-01-31",
+            granularity="hourly",  # type: ignore[arg-type]
+            ctx=ctx,
+        )
+    )
+
+    assert parsed["error"]["type"] == "invalid_parameters"
+    assert "hourly" in parsed["error"]["message"]
+    assert garmin.calls == []
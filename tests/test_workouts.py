@@ -0,0 +1,74 @@
+"""Tests for the manage_workouts tool."""
+
+import json
+
+from garmin_connect_mcp.cache import get_cache_stats
+from garmin_connect_mcp.pagination import encode_cursor
+from garmin_connect_mcp.tools.workouts import MAX_WORKOUT_LIMIT, manage_workouts
+
+WORKOUTS = [{"workoutId": i, "workoutName": f"Workout {i}"} for i in range(1, 151)]
+
+
+async def test_list_caps_limit_at_maximum(tool_context):
+    """Test that a limit above the maximum returns a full page instead of an error."""
+    ctx, _ = tool_context({"get_workouts": WORKOUTS})
+
+    parsed = json.loads(await manage_workouts("list", limit=500, ctx=ctx))
+
+    assert parsed["data"]["count"] == MAX_WORKOUT_LIMIT
+    assert parsed["data"]["total"] == len(WORKOUTS)
+    assert parsed["pagination"]["limit"] == MAX_WORKOUT_LIMIT
+    assert parsed["pagination"]["has_more"] is True
+
+
+async def test_list_returns_page_from_cursor_offset(tool_context):
+    """Test that a cursor selects the matching slice of the workout list."""
+    ctx, garmin = tool_context({"get_workouts": WORKOUTS})
+
+    parsed = json.loads(await manage_workouts("list", cursor=encode_cursor(3), limit=60, ctx=ctx))
+
+    ids = [w["workoutId"] for w in parsed["data"]["workouts"]]
+    assert ids == list(range(121, 151))
+    assert parsed["pagination"]["has_more"] is False
+    assert garmin.calls == [("get_workouts", ())]
+
+
+async def test_list_treats_non_positive_cursor_page_as_first(tool_context):
+    """Test that a cursor for page 0 or below returns the first page."""
+    ctx, _ = tool_context({"get_workouts": WORKOUTS})
+
+    parsed = json.loads(await manage_workouts("list", cursor=encode_cursor(0), limit=10, ctx=ctx))
+
+    assert [w["workoutId"] for w in parsed["data"]["workouts"]] == list(range(1, 11))
+
+
+async def test_list_without_details_skips_detail_requests(tool_context):
+    """Test that per-workout details are only fetched when include_details is set."""
+    ctx, garmin = tool_context(
+        {"get_workouts": WORKOUTS[:3], "get_workout": lambda wid: {"workoutId": wid}}
+    )
+
+    parsed = json.loads(await manage_workouts("list", ctx=ctx))
+    assert "details" not in parsed["data"]
+    assert garmin.method_names == ["get_workouts"]
+
+    parsed = json.loads(await manage_workouts("list", include_details=True, ctx=ctx))
+    assert parsed["data"]["details"] == {str(i): {"workoutId": i} for i in (1, 2, 3)}
+
+
+async def test_invalidate_clears_cached_workouts(tool_context):
+    """Test that the invalidate action drops only cached workout responses."""
+    ctx, garmin = tool_context({"get_workouts": WORKOUTS[:3], "get_stats": {}})
+    client = await ctx.get_state("client")
+    client.safe_call("get_stats", "2024-01-15")
+    await manage_workouts("list", ctx=ctx)
+    assert get_cache_stats()["total_entries"] == 2
+    garmin.calls.clear()
+
+    parsed = json.loads(await manage_workouts("invalidate", ctx=ctx))
+    assert parsed["data"] == {"invalidated": True}
+    assert get_cache_stats()["total_entries"] == 1
+
+    await manage_workouts("list", ctx=ctx)
+    client.safe_call("get_stats", "2024-01-15")
+    assert garmin.calls == [("get_workouts", ())]